@@ -1,36 +1,60 @@
 import datetime
-from collections import Counter
-from services.attendance_service import get_all_attendance_data
+from services.attendance_service import (
+    get_last_checkin, get_latest_attendance_id, get_peak_hour
+)
+
+# Analytics results keyed by the newest attendance row id at compute time.
+# Dashboard refreshes between check-ins become O(1) dict hits instead of
+# re-running the aggregation queries.
+_cache = {}
 
 class GymAI:
+    def analyze(self, member_id):
+        """
+        Computes peak hour and churn risk for one member together.
+        Screens that show both metrics side by side previously paid the
+        version lookup (and a buffer flush) twice; this checks the cache
+        once for both and only recomputes what is stale.
+        Returns: (peak_message, churn_message) strings.
+        """
+        version = get_latest_attendance_id()
+
+        peak = _cache.get("peak")
+        if not (peak and peak[0] == version):
+            peak = (version, self._compute_peak_hours())
+            _cache["peak"] = peak
+
+        churn = _cache.get(("churn", member_id))
+        if not (churn and churn[0] == version):
+            churn = (version, self._compute_churn_risk(member_id))
+            _cache[("churn", member_id)] = churn
+
+        return (peak[1], churn[1])
+
     def predict_peak_hours(self):
         """
         Analyzes check-in history to find the busiest hour of the day.
+        The heavy lifting (timestamp parsing + tallying) happens inside
+        SQLite, so this only formats the result. The answer is memoized
+        until a new check-in is recorded.
         Returns: String message (e.g., "Peak time is 6 PM")
         """
-        data = get_all_attendance_data()
+        version = get_latest_attendance_id()
+        cached = _cache.get("peak")
+        if cached and cached[0] == version:
+            return cached[1]
+
+        result = self._compute_peak_hours()
+        _cache["peak"] = (version, result)
+        return result
 
-        if not data:
+    def _compute_peak_hours(self):
+        peak = get_peak_hour()
+
+        if peak is None:
             return "Not enough data to predict peak hours yet."
 
-        # Extract hours from timestamps (Format: YYYY-MM-DD HH:MM:SS)
-        # We assume timestamp is at index 1
-        hours = []
-        for row in data:
-            try:
-                # row[1] is the string timestamp
-                dt = datetime.datetime.strptime(row[1], "%Y-%m-%d %H:%M:%S")
-                hours.append(dt.hour)
-            except (ValueError, IndexError):
-                # Skip rows with invalid date formats or missing indices
-                continue
-
-        if not hours:
-            return "Insufficient daily data."
-
-        # Find most common hour
-        # most_common is the hour (0-23), count is the frequency
-        most_common, count = Counter(hours).most_common(1)[0]
+        most_common, count = peak
 
         # Format nice string (e.g., 18 -> 6 PM)
         if most_common == 0:
@@ -39,28 +63,34 @@ class GymAI:
             return "Peak time is 12 PM (Noon)."
         if most_common < 12:
             return f"Peak time is {most_common} AM."
-        
+
         return f"Peak time is {most_common - 12} PM."
 
     def get_churn_risk(self, member_id):
         """
         Checks if a specific member hasn't visited in 14 days.
+        The latest check-in comes from an indexed MAX query, so only one
+        timestamp ever needs parsing here. Memoized per member until a
+        new check-in is recorded.
         """
-        # In a real scenario, we would query specifically for this member's last log.
-        # For this lite version, we scan the data.
-        data = get_all_attendance_data()
-
-        last_visit = None
-        for mid, timestamp in data:
-            if mid == member_id:
-                try:
-                    dt = datetime.datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
-                    if last_visit is None or dt > last_visit:
-                        last_visit = dt
-                except ValueError:
-                    continue
-
-        if not last_visit:
+        version = get_latest_attendance_id()
+        cached = _cache.get(("churn", member_id))
+        if cached and cached[0] == version:
+            return cached[1]
+
+        result = self._compute_churn_risk(member_id)
+        _cache[("churn", member_id)] = (version, result)
+        return result
+
+    def _compute_churn_risk(self, member_id):
+        timestamp = get_last_checkin(member_id)
+
+        if not timestamp:
+            return "No attendance history."
+
+        try:
+            last_visit = datetime.datetime.fromisoformat(timestamp)
+        except ValueError:
             return "No attendance history."
 
         days_since = (datetime.datetime.now() - last_visit).days
@@ -70,4 +100,4 @@ class GymAI:
         elif days_since > 14:
             return "Medium Risk (Absent 2 weeks)"
         else:
-            return "Low Risk (Active)"
\ No newline at end of file
+            return "Low Risk (Active)"
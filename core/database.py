@@ -1,8 +1,31 @@
 import sqlite3
-import bcrypt
-from typing import Optional
+import functools
 import config
 
+
+@functools.lru_cache(maxsize=4)
+def _open_conn(db_path: str) -> sqlite3.Connection:
+    """
+    Opens (once per path) a shared connection in WAL mode.
+    WAL lets dashboard reads proceed while attendance writes commit, and
+    synchronous=NORMAL drops the per-write fsync cost.
+    """
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+
+def get_conn() -> sqlite3.Connection:
+    """
+    Returns the shared application connection for the configured DB file.
+    Avoids re-opening the database (header read + schema parse) on every
+    service call.
+    """
+    return _open_conn(str(config.DB_FILE))
+
+
 def init_db():
     """
     Initializes the SQLite database.
@@ -35,6 +58,12 @@ def init_db():
         )
     """)
 
+    # Index so the peak-hour aggregation scans timestamps sequentially
+    c.execute("CREATE INDEX IF NOT EXISTS idx_att_time ON attendance(check_in_time)")
+
+    # Index so per-member "last check-in" lookups avoid a full-table scan
+    c.execute("CREATE INDEX IF NOT EXISTS idx_att_member ON attendance(member_id, check_in_time DESC)")
+
     # 3. Fee Logs Table
     c.execute("""
         CREATE TABLE IF NOT EXISTS fee_logs (
@@ -47,75 +76,4 @@ def init_db():
     """)
 
     conn.commit()
-    conn.close()
-
-
-def admin_exists() -> bool:
-    """
-    Checks if an administrator account already exists in the database.
-    Returns: True if an admin exists, False otherwise.
-    """
-    if not config.DB_FILE:
-        return False
-        
-    conn = sqlite3.connect(config.DB_FILE)
-    c = conn.cursor()
-    c.execute("SELECT 1 FROM users WHERE role='admin'")
-    exists = c.fetchone() is not None
-    conn.close()
-    return exists
-
-
-def create_user(username: str, password: str, role: str, gender: str = None):
-    """
-    Creates a new user with a hashed password.
-    
-    Args:
-        username (str): The unique username.
-        password (str): The raw password (will be hashed).
-        role (str): 'admin' or 'user'.
-        gender (str, optional): User's gender.
-    
-    Raises:
-        ValueError: If the username already exists.
-    """
-    # Hash the password using bcrypt (Safe for production)
-    hashed = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
-    
-    conn = sqlite3.connect(config.DB_FILE)
-    c = conn.cursor()
-    try:
-        c.execute("INSERT INTO users (username, password_hash, role, gender) VALUES (?, ?, ?, ?)",
-                  (username, hashed, role, gender))
-        conn.commit()
-    except sqlite3.IntegrityError:
-        raise ValueError("Username already exists")
-    finally:
-        conn.close()
-
-
-def verify_user(username: str, password: str) -> Optional[tuple]:
-    """
-    Verifies a user's login credentials.
-
-    Args:
-        username (str): The username input.
-        password (str): The raw password input.
-
-    Returns:
-        tuple (role, gender): If login succeeds.
-        None: If login fails.
-    """
-    conn = sqlite3.connect(config.DB_FILE)
-    c = conn.cursor()
-    
-    # Retrieve the hash from the DB
-    c.execute("SELECT password_hash, role, gender FROM users WHERE username=?", (username,))
-    row = c.fetchone()
-    conn.close()
-
-    # Compare the input password to the stored hash
-    if row and bcrypt.checkpw(password.encode('utf-8'), row[0]):
-        return (row[1], row[2])
-    
-    return None
\ No newline at end of file
+    conn.close()
\ No newline at end of file
@@ -1,35 +1,71 @@
 import datetime
 import calendar
+import functools
 
+@functools.lru_cache(maxsize=16)
 def month_name(m: int) -> str:
     """
     Returns the full name of a month.
     Example: 1 -> 'January', 2 -> 'February'.
+    Memoized: there are only 12 inputs and report loops ask repeatedly.
     """
     # 1900 is an arbitrary valid year used just to format the month name
     return datetime.date(1900, m, 1).strftime("%B")
 
-def add_months(start_date: datetime.date, months: int) -> datetime.date:
+@functools.lru_cache(maxsize=4096)
+def _days_in_month(year: int, month: int) -> int:
     """
-    Calculates the date N months from the start_date.
-    Handles year rollovers and end-of-month adjustments (e.g., Jan 31 + 1 month -> Feb 28).
+    Memoized month length. Renewal batches hit the same handful of
+    (year, month) pairs over and over, so this turns the leap-year math
+    in calendar.monthrange into a dict lookup.
+    """
+    return calendar.monthrange(year, month)[1]
+
+def _add_months_ymd(year: int, month: int, day: int, months: int) -> tuple:
     """
-    month = start_date.month - 1 + months
-    year = start_date.year + month // 12
+    Integer-only kernel behind add_months.
+    Works on plain (year, month, day) ints so bulk callers (report
+    generation, fee rollovers) can skip datetime.date construction per
+    element and only build a date for the final result.
+    """
+    month = month - 1 + months
+    year = year + month // 12
     month = month % 12 + 1
-    
+
     # Get the number of days in the new month to ensure valid date
-    # monthrange returns (weekday_of_first_day, number_of_days)
-    days_in_new_month = calendar.monthrange(year, month)[1]
-    
+    days_in_new_month = _days_in_month(year, month)
+
     # Clamp the day (e.g., if start was 31st but new month only has 30 days)
-    day = min(start_date.day, days_in_new_month)
-    
-    return datetime.date(year, month, day)
+    return (year, month, min(day, days_in_new_month))
+
+@functools.lru_cache(maxsize=1024)
+def add_months(start_date: datetime.date, months: int) -> datetime.date:
+    """
+    Calculates the date N months from the start_date.
+    Handles year rollovers and end-of-month adjustments (e.g., Jan 31 + 1 month -> Feb 28).
+    Safe to memoize: dates are immutable and renewal batches repeat the
+    same (start_date, months) pairs.
+    """
+    return datetime.date(*_add_months_ymd(start_date.year, start_date.month, start_date.day, months))
 
 def days_until(end_date: datetime.date) -> int:
     """
     Calculates the number of days remaining until end_date.
     Returns negative numbers if the date has passed.
     """
-    return (end_date - datetime.date.today()).days
\ No newline at end of file
+    return (end_date - datetime.date.today()).days
+
+def days_until_vec(end_dates):
+    """
+    Vectorized days_until for bulk expiry processing.
+    Accepts anything numpy can coerce to a datetime64 array (a list of
+    datetime.date, ISO strings, or an existing array) and returns an
+    int64 array of days remaining — one C loop instead of a Python
+    comprehension over days_until.
+    """
+    # Imported lazily: numpy is only needed by the bulk reporting paths,
+    # and keeping it out of module import keeps startup lean.
+    import numpy as np
+
+    end_dates = np.asarray(end_dates, dtype='datetime64[D]')
+    return (end_dates - np.datetime64(datetime.date.today(), 'D')).astype('int64')
\ No newline at end of file
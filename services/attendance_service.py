@@ -1,67 +1,321 @@
+import atexit
+import datetime
 import sqlite3
-from typing import List, Tuple, Any
+import threading
+import time
+import warnings
+from typing import Dict, List, Optional, Tuple, Any
 import config
+from core.database import get_conn
 
-def mark_attendance(member_id: str) -> bool:
+# Check-ins are buffered and written with a single executemany so rapid
+# turnstile scans don't pay one transaction (and fsync) each.
+_pending: List[Tuple[str, str]] = []
+_pending_lock = threading.Lock()
+_last_flush = time.monotonic()
+_FLUSH_BATCH = 32      # flush once this many check-ins are queued
+_FLUSH_INTERVAL = 2.0  # ...or when the oldest queued entry is this old (seconds)
+
+# Hoisted so the dashboard's polling path always passes the identical
+# string object to conn.execute — sqlite3 keys its prepared-statement
+# cache on the SQL text, so the statement is compiled once, not per poll.
+# ORDER BY id DESC walks the rowid index backwards, so no sort happens.
+_RECENT_LOGS_SQL = "SELECT member_id, check_in_time FROM attendance ORDER BY id DESC LIMIT ?"
+
+def flush_pending() -> bool:
     """
-    Records a check-in for the member in the database.
-    
+    Writes all buffered check-ins to the database in one transaction.
+    Called automatically by mark_attendance and before reads, plus at
+    interpreter exit so no scans are lost.
+
+    Returns:
+        bool: True if nothing was pending or the write succeeded.
+    """
+    global _last_flush
+
+    with _pending_lock:
+        if not _pending:
+            return True
+        batch = _pending[:]
+        del _pending[:]
+        _last_flush = time.monotonic()
+
+    if mark_attendance_bulk(batch):
+        return True
+
+    # Write failed (locked DB, disk full, ...). The callers of these
+    # buffered scans were already told True, so the batch must not be
+    # dropped — put it back in front of anything queued meanwhile and
+    # let the next flush retry.
+    with _pending_lock:
+        _pending[:0] = batch
+    return False
+
+atexit.register(flush_pending)
+
+def mark_attendance_bulk(entries: List[Tuple[str, str]]) -> bool:
+    """
+    Writes many (member_id, check_in_time) check-ins in one transaction.
+    For callers that already hold a batch (bulk imports, hardware
+    bridges, flush_pending); interactive scans should keep using
+    mark_attendance, which buffers into this automatically.
+
     Args:
-        member_id (str): The ID of the member checking in.
-        
+        entries: (member_id, 'YYYY-MM-DD HH:MM:SS') pairs to insert.
+
     Returns:
-        bool: True if successful, False otherwise.
+        bool: True if the batch was empty or the write succeeded.
     """
+    if not entries:
+        return True
     if not config.DB_FILE:
         return False
 
     try:
-        with sqlite3.connect(config.DB_FILE) as conn:
-            c = conn.cursor()
-            c.execute("INSERT INTO attendance (member_id) VALUES (?)", (member_id,))
-            conn.commit()
+        conn = get_conn()
+        conn.executemany("INSERT INTO attendance (member_id, check_in_time) VALUES (?, ?)", entries)
+        conn.commit()
         return True
     except sqlite3.Error as e:
-        print(f"Database error during attendance mark: {e}")
+        print(f"Database error writing attendance batch: {e}")
+        return False
+
+def mark_attendance(member_id: str) -> bool:
+    """
+    Records a check-in for the member in the database.
+    The entry is buffered and flushed in batches (see flush_pending), so
+    bursts of scans share one transaction instead of one fsync each.
+
+    Args:
+        member_id (str): The ID of the member checking in.
+
+    Returns:
+        bool: True if successful, False otherwise.
+    """
+    if not config.DB_FILE:
         return False
 
+    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    with _pending_lock:
+        _pending.append((member_id, now))
+        should_flush = (len(_pending) >= _FLUSH_BATCH
+                        or time.monotonic() - _last_flush > _FLUSH_INTERVAL)
+
+    if should_flush:
+        return flush_pending()
+    return True
+
 def get_recent_logs(limit: int = 50) -> List[Tuple[Any, ...]]:
     """
     Gets the most recent check-ins for the dashboard display.
-    
+
     Args:
         limit (int): Number of records to retrieve. Defaults to 50.
-        
+
     Returns:
         List[Tuple]: A list of rows containing (member_id, check_in_time).
     """
     if not config.DB_FILE:
         return []
 
+    # Make sure buffered check-ins are visible to this read
+    flush_pending()
+
     try:
-        with sqlite3.connect(config.DB_FILE) as conn:
-            c = conn.cursor()
-            c.execute("SELECT member_id, check_in_time FROM attendance ORDER BY id DESC LIMIT ?", (limit,))
-            return c.fetchall()
+        conn = get_conn()
+        c = conn.cursor()
+        c.execute(_RECENT_LOGS_SQL, (limit,))
+        return c.fetchall()
     except sqlite3.Error as e:
         print(f"Database error fetching recent logs: {e}")
         return []
 
+def get_peak_hour() -> Optional[Tuple[int, int]]:
+    """
+    Finds the busiest check-in hour using SQL aggregation.
+    SQLite parses the timestamps and tallies the hours in C, so only
+    a single row crosses back into Python regardless of table size.
+
+    Returns:
+        Tuple (hour, count): The busiest hour (0-23) and its check-in count.
+        None: If there is no attendance data yet.
+    """
+    if not config.DB_FILE:
+        return None
+
+    # Make sure buffered check-ins are visible to this read
+    flush_pending()
+
+    try:
+        conn = get_conn()
+        c = conn.cursor()
+        c.execute(
+            "SELECT strftime('%H', check_in_time) AS h, COUNT(*) "
+            "FROM attendance GROUP BY h ORDER BY COUNT(*) DESC LIMIT 1"
+        )
+        row = c.fetchone()
+        if row and row[0] is not None:
+            return (int(row[0]), row[1])
+        return None
+    except sqlite3.Error as e:
+        print(f"Database error fetching peak hour: {e}")
+        return None
+
+def get_last_checkin(member_id: str) -> Optional[str]:
+    """
+    Gets a member's most recent check-in timestamp via an indexed MAX query.
+
+    Args:
+        member_id (str): The ID of the member to look up.
+
+    Returns:
+        str: The latest check-in timestamp ('YYYY-MM-DD HH:MM:SS').
+        None: If the member has no attendance history.
+    """
+    if not config.DB_FILE:
+        return None
+
+    # Make sure buffered check-ins are visible to this read
+    flush_pending()
+
+    try:
+        conn = get_conn()
+        c = conn.cursor()
+        c.execute("SELECT MAX(check_in_time) FROM attendance WHERE member_id=?", (member_id,))
+        row = c.fetchone()
+        return row[0] if row else None
+    except sqlite3.Error as e:
+        print(f"Database error fetching last check-in: {e}")
+        return None
+
+def get_latest_attendance_id() -> Optional[int]:
+    """
+    Returns the highest attendance row id (a microsecond query).
+    Used by the analytics cache to detect whether anything changed
+    since the last computation.
+    """
+    if not config.DB_FILE:
+        return None
+
+    flush_pending()
+
+    try:
+        conn = get_conn()
+        c = conn.cursor()
+        c.execute("SELECT MAX(id) FROM attendance")
+        row = c.fetchone()
+        return row[0] if row else None
+    except sqlite3.Error as e:
+        print(f"Database error fetching latest attendance id: {e}")
+        return None
+
+def get_hour_histogram() -> List[Tuple[int, int]]:
+    """
+    Tallies check-ins per hour of day, entirely in SQL.
+
+    Returns:
+        List[Tuple]: (hour, count) pairs for hours 0-23 that have data,
+        ordered by hour.
+    """
+    if not config.DB_FILE:
+        return []
+
+    # Make sure buffered check-ins are visible to this read
+    flush_pending()
+
+    try:
+        conn = get_conn()
+        c = conn.cursor()
+        c.execute(
+            "SELECT strftime('%H', check_in_time) AS h, COUNT(*) "
+            "FROM attendance GROUP BY h ORDER BY h"
+        )
+        return [(int(h), n) for h, n in c.fetchall() if h is not None]
+    except sqlite3.Error as e:
+        print(f"Database error fetching hour histogram: {e}")
+        return []
+
+def get_daily_counts(since: datetime.date) -> List[Tuple[str, int]]:
+    """
+    Counts check-ins per calendar day from `since` onwards.
+
+    Args:
+        since (datetime.date): Earliest day to include.
+
+    Returns:
+        List[Tuple]: ('YYYY-MM-DD', count) pairs ordered by day.
+    """
+    if not config.DB_FILE:
+        return []
+
+    # Make sure buffered check-ins are visible to this read
+    flush_pending()
+
+    try:
+        conn = get_conn()
+        c = conn.cursor()
+        c.execute(
+            "SELECT date(check_in_time) AS d, COUNT(*) "
+            "FROM attendance WHERE d >= ? GROUP BY d ORDER BY d",
+            (since.isoformat(),)
+        )
+        return c.fetchall()
+    except sqlite3.Error as e:
+        print(f"Database error fetching daily counts: {e}")
+        return []
+
+def get_member_last_seen() -> Dict[str, str]:
+    """
+    Gets every member's most recent check-in in one grouped query.
+    Bulk counterpart to get_last_checkin for expiry/churn screens.
+
+    Returns:
+        Dict[str, str]: member_id -> latest check-in timestamp.
+    """
+    if not config.DB_FILE:
+        return {}
+
+    # Make sure buffered check-ins are visible to this read
+    flush_pending()
+
+    try:
+        conn = get_conn()
+        c = conn.cursor()
+        c.execute("SELECT member_id, MAX(check_in_time) FROM attendance GROUP BY member_id")
+        return dict(c.fetchall())
+    except sqlite3.Error as e:
+        print(f"Database error fetching last-seen map: {e}")
+        return {}
+
 def get_all_attendance_data() -> List[Tuple[Any, ...]]:
     """
     Fetches ALL attendance history for AI analysis.
-    
+
+    Deprecated: this transfers every row into Python and grows without
+    bound. Use the SQL-side aggregators (get_hour_histogram,
+    get_daily_counts, get_member_last_seen) instead.
+
     Returns:
         List[Tuple]: A list of all (member_id, check_in_time) records.
     """
+    warnings.warn(
+        "get_all_attendance_data is deprecated; use the SQL-side "
+        "aggregators in attendance_service instead.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+
     if not config.DB_FILE:
         return []
 
+    # Make sure buffered check-ins are visible to this read
+    flush_pending()
+
     try:
-        with sqlite3.connect(config.DB_FILE) as conn:
-            c = conn.cursor()
-            c.execute("SELECT member_id, check_in_time FROM attendance")
-            return c.fetchall()
+        conn = get_conn()
+        c = conn.cursor()
+        c.execute("SELECT member_id, check_in_time FROM attendance")
+        return c.fetchall()
     except sqlite3.Error as e:
         print(f"Database error fetching all data: {e}")
-        return []
\ No newline at end of file
+        return []
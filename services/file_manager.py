@@ -1,3 +1,5 @@
+import os
+import shutil
 import sys
 from pathlib import Path
 from PySide6 import QtWidgets
@@ -9,6 +11,23 @@ def ensure_folder(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
 
+def ingest_photo(src, dest) -> None:
+    """
+    Stages a member photo into the photos folder.
+    Always copies the data (1 MiB buffer) — never hardlinks. Both
+    sources are mutable: the camera rewrites one fixed temp file in
+    place, and an uploaded original stays editable by the user, so a
+    linked dest would silently change whenever its source inode does.
+    Metadata preservation is unneeded since the file is renamed to the
+    member ID anyway.
+    """
+    src, dest = os.fspath(src), os.fspath(dest)
+    if os.path.exists(dest):
+        os.remove(dest)
+    with open(src, 'rb') as a, open(dest, 'wb') as b:
+        shutil.copyfileobj(a, b, 1 << 20)
+
+
 def init_paths(base_path: Path) -> None:
     """
     Initialize all global paths based on the selected base path.
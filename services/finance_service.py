@@ -1,16 +1,17 @@
 import sqlite3
 from typing import List, Tuple, Any
 import config
+from core.database import get_conn
 
 def log_fee_update(staff_name: str, member_id: str, months: int) -> bool:
     """
     Records a fee update transaction in the database.
-    
+
     Args:
         staff_name (str): The name of the staff member (admin) performing the action.
         member_id (str): The ID of the member receiving the update.
         months (int): Number of months added to the membership.
-        
+
     Returns:
         bool: True if successful, False otherwise.
     """
@@ -18,11 +19,11 @@ def log_fee_update(staff_name: str, member_id: str, months: int) -> bool:
         return False
 
     try:
-        with sqlite3.connect(config.DB_FILE) as conn:
-            c = conn.cursor()
-            c.execute("INSERT INTO fee_logs (staff_name, member_id, months_added) VALUES (?, ?, ?)",
-                      (staff_name, member_id, months))
-            conn.commit()
+        conn = get_conn()
+        c = conn.cursor()
+        c.execute("INSERT INTO fee_logs (staff_name, member_id, months_added) VALUES (?, ?, ?)",
+                  (staff_name, member_id, months))
+        conn.commit()
         return True
     except sqlite3.Error as e:
         print(f"Database error logging fee: {e}")
@@ -31,7 +32,7 @@ def log_fee_update(staff_name: str, member_id: str, months: int) -> bool:
 def get_fee_logs() -> List[Tuple[Any, ...]]:
     """
     Fetches all fee records from the database, sorted by newest first.
-    
+
     Returns:
         List[Tuple]: A list of tuples containing (id, timestamp, staff_name, member_id, months_added).
     """
@@ -39,10 +40,10 @@ def get_fee_logs() -> List[Tuple[Any, ...]]:
         return []
 
     try:
-        with sqlite3.connect(config.DB_FILE) as conn:
-            c = conn.cursor()
-            c.execute("SELECT id, timestamp, staff_name, member_id, months_added FROM fee_logs ORDER BY id DESC")
-            return c.fetchall()
+        conn = get_conn()
+        c = conn.cursor()
+        c.execute("SELECT id, timestamp, staff_name, member_id, months_added FROM fee_logs ORDER BY id DESC")
+        return c.fetchall()
     except sqlite3.Error as e:
         print(f"Database error fetching fee logs: {e}")
-        return []
\ No newline at end of file
+        return []
@@ -0,0 +1,257 @@
+import functools
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+import config
+
+# On-disk index of member records so status/search queries become
+# indexed SELECTs instead of parsing every PDF in the tree. One row per
+# member id — re-admissions and renewals replace the row, so the index
+# always points at the newest record, matching what the scanners kept.
+
+_INDEX_FILENAME = ".members_index.db"
+
+
+def _index_path() -> str:
+    return str(config.BASE_FOLDER / _INDEX_FILENAME)
+
+
+@functools.lru_cache(maxsize=4)
+def _open_conn(db_path: str) -> sqlite3.Connection:
+    """Opens (once per path) the index connection in WAL mode."""
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS members (
+            id TEXT PRIMARY KEY,
+            name TEXT,
+            gender TEXT,
+            status TEXT,
+            path TEXT,
+            mtime REAL,
+            day INTEGER,
+            month INTEGER,
+            year INTEGER,
+            package TEXT,
+            end_date TEXT
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_members_status ON members(lower(status))")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_members_name ON members(lower(name))")
+    conn.commit()
+    return conn
+
+
+def get_conn() -> sqlite3.Connection:
+    """Returns the shared connection to the member index database."""
+    return _open_conn(_index_path())
+
+
+def upsert(data: Dict[str, Any], path: str) -> None:
+    """
+    Inserts or replaces the index row for one member.
+    Called after every PDF write (save/approve/renew) with the member's
+    field dict and the path of the record just written.
+    """
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        mtime = 0.0
+
+    try:
+        conn = get_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO members "
+            "(id, name, gender, status, path, mtime, day, month, year, package, end_date) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                str(data.get('id', '')),
+                data.get('name'),
+                data.get('gender'),
+                data.get('status'),
+                path,
+                mtime,
+                data.get('day'),
+                data.get('month'),
+                data.get('year'),
+                data.get('package'),
+                str(data.get('end_date')) if data.get('end_date') is not None else None,
+            )
+        )
+        conn.commit()
+    except sqlite3.Error as e:
+        print(f"Index error upserting member {data.get('id')}: {e}")
+
+
+def delete(member_id: str) -> None:
+    """Removes a member from the index."""
+    try:
+        conn = get_conn()
+        conn.execute("DELETE FROM members WHERE id=?", (member_id,))
+        conn.commit()
+    except sqlite3.Error as e:
+        print(f"Index error deleting member {member_id}: {e}")
+
+
+def query_by_status(status: str) -> List[Tuple[Any, ...]]:
+    """
+    Returns (id, name, gender, status, path, day, month, year) rows for
+    every member with the given status, newest record first.
+    """
+    try:
+        conn = get_conn()
+        c = conn.cursor()
+        c.execute(
+            "SELECT id, name, gender, status, path, day, month, year "
+            "FROM members WHERE lower(status)=? ORDER BY mtime DESC",
+            (status.lower(),)
+        )
+        return c.fetchall()
+    except sqlite3.Error as e:
+        print(f"Index error querying status {status}: {e}")
+        return []
+
+
+def search(query: str, gender_filter: Optional[str] = None) -> List[Tuple[str, str, str, float]]:
+    """
+    Substring search over member ids and names (case-insensitive).
+    Returns (id, name, path, mtime) rows, newest first. When
+    gender_filter is given (lowercase), rows of other genders are
+    excluded in-engine rather than after the fetch.
+    """
+    like = f"%{query.lower()}%"
+    sql = ("SELECT id, name, path, mtime FROM members "
+           "WHERE (lower(id) LIKE ? OR lower(name) LIKE ?)")
+    params: Tuple[Any, ...] = (like, like)
+    if gender_filter:
+        sql += " AND lower(gender) = ?"
+        params += (gender_filter,)
+    sql += " ORDER BY mtime DESC"
+    try:
+        conn = get_conn()
+        c = conn.cursor()
+        c.execute(sql, params)
+        return c.fetchall()
+    except sqlite3.Error as e:
+        print(f"Index error searching for {query!r}: {e}")
+        return []
+
+
+def get(member_id: str, gender_filter: Optional[str] = None) -> Optional[Tuple[Any, ...]]:
+    """
+    Returns the (path, mtime) row for one member id, if indexed.
+    With gender_filter set (lowercase), a member of another gender is
+    treated as not found.
+    """
+    sql = "SELECT path, mtime FROM members WHERE lower(id)=?"
+    params: Tuple[Any, ...] = (member_id.lower(),)
+    if gender_filter:
+        sql += " AND lower(gender) = ?"
+        params += (gender_filter,)
+    try:
+        conn = get_conn()
+        c = conn.cursor()
+        c.execute(sql, params)
+        return c.fetchone()
+    except sqlite3.Error as e:
+        print(f"Index error fetching member {member_id}: {e}")
+        return None
+
+
+def all_members() -> List[Tuple[str, str]]:
+    """Returns (id, name) for every indexed member."""
+    try:
+        conn = get_conn()
+        c = conn.cursor()
+        c.execute("SELECT id, name FROM members")
+        return c.fetchall()
+    except sqlite3.Error as e:
+        print(f"Index error listing members: {e}")
+        return []
+
+
+def is_empty() -> bool:
+    """True if the index holds no rows (fresh file or never built)."""
+    try:
+        conn = get_conn()
+        c = conn.cursor()
+        c.execute("SELECT 1 FROM members LIMIT 1")
+        return c.fetchone() is None
+    except sqlite3.Error:
+        return True
+
+
+def rebuild_index() -> int:
+    """
+    One-time bootstrap: walks the whole data tree, parses every PDF and
+    rebuilds the index from scratch. Keeps only the newest record per
+    member id (re-admissions/renewals), like the old scanners did.
+
+    Returns:
+        int: Number of members indexed.
+    """
+    # Imported here to avoid a circular import (member_service uses this
+    # module for its queries).
+    from services.member_service import _iter_member_pdfs
+    from services.pdf_service import parse_member_from_pdf
+
+    # Stream the walk into a newest-per-member table before parsing
+    # anything: records share their member id as filename (originals and
+    # ReAdmission_* copies alike, as the scanners already rely on), so
+    # the mtime compare alone rules out stale re-admissions and only one
+    # PDF per member is ever parsed.
+    best: Dict[str, Tuple[str, float]] = {}
+    for entry in _iter_member_pdfs():
+        stem = entry.name[:-4].lower()
+        mtime = entry.stat().st_mtime
+        prev = best.get(stem)
+        if prev is None or mtime > prev[1]:
+            best[stem] = (entry.path, mtime)
+
+    paths = [path for path, _ in best.values()]
+
+    # PDF text extraction is CPU-bound Python, so for a real backlog the
+    # parses are spread across cores. Small trees skip the pool — worker
+    # startup would cost more than it saves.
+    if len(paths) > 32:
+        try:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+                parsed = list(ex.map(parse_member_from_pdf, paths, chunksize=16))
+        except Exception as e:
+            print(f"Index rebuild pool failed, parsing sequentially: {e}")
+            parsed = [parse_member_from_pdf(p) for p in paths]
+    else:
+        parsed = [parse_member_from_pdf(p) for p in paths]
+
+    newest: Dict[str, Tuple[Dict[str, Any], str, float]] = {}
+    for (path, mtime), data in zip(best.values(), parsed):
+        if not data or not data.get('id'):
+            continue
+        mid = str(data['id'])
+        if mid not in newest or mtime > newest[mid][2]:
+            newest[mid] = (data, path, mtime)
+
+    try:
+        conn = get_conn()
+        conn.execute("DELETE FROM members")
+        conn.commit()
+    except sqlite3.Error as e:
+        print(f"Index error clearing for rebuild: {e}")
+        return 0
+
+    for data, path, _ in newest.values():
+        upsert(data, path)
+
+    # The in-memory search trie mirrors this table; force a rebuild
+    from services import name_index
+    name_index.invalidate()
+
+    return len(newest)
+
+
+def ensure_index() -> None:
+    """Rebuilds the index the first time it is queried on an old tree."""
+    if is_empty():
+        rebuild_index()
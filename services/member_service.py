@@ -1,12 +1,75 @@
+import atexit
+import os
 import shutil
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Any, Union
 import config
 from core.utils import month_name
 from models.member import Member
+from services import index_db
+from services import name_index
 from services.pdf_service import create_member_pdf, parse_member_from_pdf
 
+# --- TREE TRAVERSAL HELPERS ---
+
+def _scandir_recursive(path: Union[str, Path]) -> Iterator[os.DirEntry]:
+    """
+    Walks a directory tree yielding os.DirEntry objects.
+    Unlike Path.rglob, the entries carry the file type and stat info read
+    from the directory itself, so callers can check is_dir()/st_mtime
+    without extra stat() syscalls per file.
+    """
+    stack = [str(path)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    yield entry
+        except OSError as e:
+            print(f"Error scanning {current}: {e}")
+
+def _iter_member_pdfs() -> Iterator[os.DirEntry]:
+    """Yields a DirEntry for every member PDF under the data folder."""
+    if not config.BASE_FOLDER.exists():
+        return
+    for entry in _scandir_recursive(config.BASE_FOLDER):
+        if entry.is_file(follow_symlinks=False) and entry.name.endswith(".pdf"):
+            yield entry
+
+# --- MONTHLY LOG BUFFERING ---
+
+# Raw append fds to monthly_members.txt, one per month file.
+# Registration previously paid mkdir + open + close per member; a
+# cached O_APPEND descriptor turns each entry into a single write(2),
+# atomic for short lines, with no text-IO encoder/buffer layer between.
+_log_fds: Dict[str, int] = {}
+
+def _get_log_fd(log_file: Path) -> int:
+    """Returns a cached append-mode file descriptor for a monthly log."""
+    key = str(log_file)
+    fd = _log_fds.get(key)
+    if fd is None:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+        fd = os.open(key, flags, 0o644)
+        _log_fds[key] = fd
+    return fd
+
+def _close_log_fds() -> None:
+    for fd in _log_fds.values():
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+    _log_fds.clear()
+
+atexit.register(_close_log_fds)
+
 # --- CORE SAVING & FINDING ---
 
 def save_new_member(member: Member) -> str:
@@ -28,9 +91,9 @@ def save_new_member(member: Member) -> str:
     base = config.BASE_FOLDER / year / monthn / day / member.id
     base.mkdir(parents=True, exist_ok=True)
 
-    # Check for re-admission (existing PDF implies previous registration)
-    existing = list(base.glob("*.pdf"))
-    if existing:
+    # Check for re-admission (existing PDF implies previous registration).
+    # next() stops at the first PDF instead of materializing the whole list.
+    if next(base.glob("*.pdf"), None) is not None:
         # Create a subfolder like "ReAdmission_1"
         count = len([d for d in base.iterdir() if d.is_dir()]) + 1
         re_dir = base / f"ReAdmission_{count}"
@@ -42,81 +105,132 @@ def save_new_member(member: Member) -> str:
     # Generate the actual PDF
     create_member_pdf(save_path, member.__dict__)
 
+    # Keep the on-disk index pointing at the newest record for this id,
+    # and the in-memory search trie in step with it
+    index_db.upsert(member.__dict__, str(save_path))
+    name_index.add_member(member.id, member.name)
+
     # Log to monthly text file (Quick lookup log)
     log_file = config.BASE_FOLDER / year / monthn / "monthly_members.txt"
-    log_file.parent.mkdir(parents=True, exist_ok=True)
-    
+
     entry = f"{member.id} — {member.name} — {member.day:02d}/{member.month:02d}/{member.year} — {member.status}\n"
-    
+
     try:
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(entry)
+        os.write(_get_log_fd(log_file), entry.encode("utf-8"))
     except Exception as e:
         print(f"Failed to write to text log: {e}")
 
     return str(save_path)
 
 
+# Listing of the photos folder as {lowercased stem: path}, keyed by the
+# folder's mtime so adding/removing a photo invalidates it. Saves an
+# O(photos) iterdir per lookup. _photo_miss remembers ids confirmed to
+# have no photo (common for bulk legacy data), so their repeat lookups
+# skip even the folder stat.
+_photo_cache: Optional[Tuple[float, Dict[str, str]]] = None
+_photo_miss: set = set()
+
+def _photo_table() -> Dict[str, str]:
+    """Returns the (cached) stem -> path table for the photos folder."""
+    global _photo_cache
+
+    try:
+        mtime = os.stat(config.PHOTOS_FOLDER).st_mtime
+    except OSError:
+        return {}
+
+    if _photo_cache is not None and _photo_cache[0] == mtime:
+        return _photo_cache[1]
+
+    table: Dict[str, str] = {}
+    with os.scandir(config.PHOTOS_FOLDER) as it:
+        for entry in it:
+            if entry.is_file(follow_symlinks=False):
+                table[entry.name.rsplit('.', 1)[0].lower()] = entry.path
+
+    _photo_cache = (mtime, table)
+    _photo_miss.clear()  # the folder changed; old misses may be stale
+    return table
+
+def invalidate_photo_cache() -> None:
+    """
+    Drops the listing and negative caches. Call after placing a photo
+    in the folder so the new file is seen without waiting for an
+    unrelated lookup to notice the mtime change.
+    """
+    global _photo_cache
+    _photo_cache = None
+    _photo_miss.clear()
+
 def find_photo(member_id: str) -> Optional[str]:
     """
     Helper to find a member's photo path regardless of extension (.jpg, .png) or casing.
     """
-    if not config.PHOTOS_FOLDER.exists():
+    # The cached table is keyed on lowercased stems, which already covers
+    # both the old per-extension exists() probes (4 stat calls) and the
+    # case-insensitive directory walk — one dict lookup does it all.
+    clean_id = member_id.strip().lower()
+    if clean_id in _photo_miss:
         return None
 
-    # 1. Check exact match with common extensions
-    for ext in [".jpg", ".png", ".jpeg", ".bmp"]:
-        p = config.PHOTOS_FOLDER / f"{member_id}{ext}"
-        if p.exists():
-            return str(p)
-
-    # 2. Check case-insensitive match (slower, but safer)
-    clean_id = member_id.strip().lower()
-    for f in config.PHOTOS_FOLDER.iterdir():
-        if f.stem.lower() == clean_id:
-            return str(f)
-            
-    return None
+    path = _photo_table().get(clean_id)
+    if path is None:
+        _photo_miss.add(clean_id)
+    return path
 
 
-def search_members(query: str) -> Dict[str, Any]:
+def search_members(query: str, gender_filter: Optional[str] = None) -> Dict[str, Any]:
     """
     Searches for members by ID or Name across all stored PDFs.
-    
+
     Args:
         query (str): The search term (ID or Name).
-        
+        gender_filter (str): Lowercase gender; when given, members of
+            other genders are filtered out by the index engine itself
+            (gender-restricted staff searches).
+
     Returns:
         Dict: Contains 'matches' (list of paths) and 'parsed' (data of best match).
     """
     ql = query.lower().strip()
-    
-    # 1. Quick Search: Match filename (ID)
-    matches = [p for p in config.BASE_FOLDER.rglob("*.pdf") if ql in p.stem.lower()]
-
-    # 2. Deep Search: Parse PDFs to match Name (if no filename match)
-    if not matches:
-        for pdf_path in config.BASE_FOLDER.rglob("*.pdf"):
-            try:
-                parsed = parse_member_from_pdf(pdf_path)
-                if parsed and ql in parsed.get('name', '').lower():
-                    matches.append(pdf_path)
-            except Exception:
-                continue
-
-    if not matches:
+    if not ql or not config.BASE_FOLDER.exists():
+        return {"matches": []}
+
+    index_db.ensure_index()
+
+    # 1. Quick Search: prefix hit on an ID or a name word via the
+    # in-memory trie — O(len(query)) per keystroke. The newest record
+    # ("Best Result") is tracked in the same pass.
+    paths: List[str] = []
+    latest_path: Optional[str] = None
+    latest_mtime = -1.0
+    for mid in name_index.lookup(ql):
+        row = index_db.get(mid, gender_filter)
+        if row:
+            path, mtime = row
+            paths.append(path)
+            if mtime > latest_mtime:
+                latest_mtime, latest_path = mtime, path
+
+    # 2. Deep Search: substring match against the index (covers queries
+    # that land mid-id or mid-word, which a prefix trie can't). Rows
+    # arrive newest-first, so the best result is simply the first.
+    if not paths:
+        paths = [path for _mid, _name, path, _mtime in index_db.search(ql, gender_filter)]
+        latest_path = paths[0] if paths else None
+
+    if latest_path is None:
         return {"matches": []}
 
-    # Find the most recently modified file among matches to show as "Best Result"
-    latest = max(matches, key=lambda p: p.stat().st_mtime)
-    parsed = parse_member_from_pdf(latest)
+    parsed = parse_member_from_pdf(latest_path)
 
     if parsed:
         photo = find_photo(parsed.get('id', ''))
         if photo:
             parsed['photo_path'] = photo
 
-    return {"matches": [str(p) for p in matches], "parsed": parsed}
+    return {"matches": paths, "parsed": parsed}
 
 
 def get_member_by_id(member_id: str) -> Optional[Dict[str, Any]]:
@@ -124,18 +238,24 @@ def get_member_by_id(member_id: str) -> Optional[Dict[str, Any]]:
     Retrieves the latest member data for a specific ID.
     Used for Check-In, Renewal, and Status Updates.
     """
-    found_pdfs = []
-    # Find all PDFs with this ID (could be original + readmissions)
-    for pdf_path in config.BASE_FOLDER.rglob("*.pdf"):
-        if pdf_path.stem.lower() == member_id.lower().strip():
-            found_pdfs.append(pdf_path)
+    target = member_id.lower().strip()
+
+    # Single streaming pass: track the newest matching record (original
+    # or re-admission) as the walk goes, instead of collecting all
+    # matches and running max() over them afterwards.
+    best_path: Optional[str] = None
+    best_mtime = -1.0
+    for entry in _iter_member_pdfs():
+        if entry.name[:-4].lower() != target:
+            continue
+        mtime = entry.stat().st_mtime  # cached from the directory read
+        if mtime > best_mtime:
+            best_mtime, best_path = mtime, entry.path
 
-    if not found_pdfs:
+    if best_path is None:
         return None
 
-    # Get the newest one
-    latest_pdf = max(found_pdfs, key=lambda p: p.stat().st_mtime)
-    data = parse_member_from_pdf(latest_pdf)
+    data = parse_member_from_pdf(best_path)
 
     if data:
         photo = find_photo(data.get('id', ''))
@@ -149,27 +269,24 @@ def get_member_by_id(member_id: str) -> Optional[Dict[str, Any]]:
 
 def get_pending_members() -> List[Dict[str, Any]]:
     """
-    Scans all records for members with 'Status: Pending'.
+    Lists members with 'Status: Pending' from the on-disk index.
     Returns a list of summary dictionaries for the dashboard.
     """
-    pending_list = []
     if not config.BASE_FOLDER.exists():
         return []
 
-    for pdf_path in config.BASE_FOLDER.rglob("*.pdf"):
-        try:
-            data = parse_member_from_pdf(pdf_path)
-            if data and data.get('status', '').lower() == 'pending':
-                pending_list.append({
-                    'id': data.get('id', 'Unknown'),
-                    'name': data.get('name', 'Unknown'),
-                    'gender': data.get('gender', 'Unknown'),
-                    'date': f"{data.get('day')}/{data.get('month')}/{data.get('year')}",
-                    'path': str(pdf_path)
-                })
-        except Exception:
-            continue
-            
+    index_db.ensure_index()
+
+    pending_list = []
+    for mid, name, gender, _status, path, day, month, year in index_db.query_by_status('pending'):
+        pending_list.append({
+            'id': mid or 'Unknown',
+            'name': name or 'Unknown',
+            'gender': gender or 'Unknown',
+            'date': f"{day}/{month}/{year}",
+            'path': path
+        })
+
     return pending_list
 
 
@@ -202,20 +319,61 @@ def update_member_status(member_id: str, new_status: str) -> None:
     save_new_member(m)
 
 
+def approve_all_pending(member_ids: List[str]) -> List[str]:
+    """
+    Approves a batch of pending members (Pending -> Active) in parallel.
+    Each approval re-renders a PDF, which serialized badly in a loop;
+    a small thread pool overlaps the rendering and file I/O.
+
+    Args:
+        member_ids (List[str]): IDs to approve.
+
+    Returns:
+        List[str]: IDs that could not be approved.
+    """
+    failed: List[str] = []
+    if not member_ids:
+        return failed
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = {mid: pool.submit(update_member_status, mid, "Active")
+                   for mid in member_ids}
+
+    for mid, future in futures.items():
+        try:
+            future.result()
+        except Exception as e:
+            print(f"Error approving member {mid}: {e}")
+            failed.append(mid)
+
+    return failed
+
+
 def delete_member(member_id: str) -> bool:
     """
     Permanently deletes a member's entire folder structure.
     """
     deleted = False
-    # rglob finds folders matching the ID anywhere in the hierarchy
-    for folder in config.BASE_FOLDER.rglob(member_id):
-        if folder.is_dir() and folder.name == member_id:
-            try:
-                shutil.rmtree(folder)
-                deleted = True
-            except Exception as e:
-                print(f"Error deleting folder {folder}: {e}")
-                
+    if not config.BASE_FOLDER.exists():
+        return False
+
+    # Collect matches first so rmtree doesn't pull folders out from under
+    # the walk in progress.
+    targets = [entry.path for entry in _scandir_recursive(config.BASE_FOLDER)
+               if entry.is_dir(follow_symlinks=False) and entry.name == member_id]
+
+    for folder in targets:
+        try:
+            shutil.rmtree(folder)
+            deleted = True
+        except Exception as e:
+            print(f"Error deleting folder {folder}: {e}")
+
+    if deleted:
+        index_db.delete(member_id)
+        # Tokens can't be cheaply removed from the trie; rebuild lazily
+        name_index.invalidate()
+
     return deleted
 
 
@@ -254,7 +412,7 @@ def get_monthly_list(year: int, month: int) -> str:
     Reads the 'monthly_members.txt' file for a specific month.
     """
     file_path = config.BASE_FOLDER / str(year) / month_name(month) / "monthly_members.txt"
-    
+
     if not file_path.exists():
         return "No new members recorded this month."
         
@@ -266,34 +424,17 @@ def get_monthly_list(year: int, month: int) -> str:
 
 def get_members_by_status(status: str) -> str:
     """
-    Scans all PDFs to find members with a specific status (Active/Expired).
-    Returns a formatted string list.
+    Lists members with a specific status (Active/Expired) from the
+    on-disk index. Returns a formatted string list, newest first.
     """
     if not config.BASE_FOLDER.exists():
         return f"No members found with status: {status}"
 
-    member_dict = {}
-
-    # Scan all PDFs
-    for pdf_path in config.BASE_FOLDER.rglob("*.pdf"):
-        try:
-            parsed = parse_member_from_pdf(pdf_path)
-            if parsed and parsed.get('status', '').lower() == status.lower():
-                member_id = parsed.get('id', '')
-                
-                # Keep only the latest record for each ID (handle re-admissions/renewals)
-                # member_dict value format: (parsed_data, modification_time)
-                if member_id not in member_dict or pdf_path.stat().st_mtime > member_dict[member_id][1]:
-                    member_dict[member_id] = (parsed, pdf_path.stat().st_mtime)
-        except Exception:
-            continue
-
-    # Sort by date modified (newest first)
-    sorted_members = sorted(member_dict.items(), key=lambda x: x[1][1], reverse=True)
+    index_db.ensure_index()
 
     lines = []
-    for _, (parsed, _) in sorted_members:
-        lines.append(f"{parsed['id']} — {parsed['name']} — Status: {parsed['status']}")
+    for mid, name, _gender, row_status, _path, _d, _m, _y in index_db.query_by_status(status):
+        lines.append(f"{mid} — {name} — Status: {row_status}")
 
     if not lines:
         return f"No members found with status: {status}"
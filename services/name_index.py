@@ -0,0 +1,91 @@
+import threading
+from typing import Optional, Set
+from services import index_db
+
+# In-memory prefix trie over member ids and name tokens, so the search
+# box resolves a prefix in O(len(query)) instead of scanning every
+# record per keystroke. Built lazily from the SQLite index and kept
+# current on saves; deletes just drop it and the next lookup rebuilds.
+
+# Leaf payloads (sets of member ids) live under this key inside each
+# trie node, so it can never collide with a real character.
+_LEAF = None
+
+
+class Trie:
+    """Dict-of-dicts prefix trie mapping tokens to sets of member ids."""
+
+    __slots__ = ("_root",)
+
+    def __init__(self):
+        self._root = {}
+
+    def insert(self, token: str, member_id: str) -> None:
+        node = self._root
+        for ch in token:
+            node = node.setdefault(ch, {})
+        node.setdefault(_LEAF, set()).add(member_id)
+
+    def prefix_ids(self, prefix: str) -> Set[str]:
+        """All member ids whose indexed token starts with `prefix`."""
+        node = self._root
+        for ch in prefix:
+            node = node.get(ch)
+            if node is None:
+                return set()
+
+        # Collect every payload in the subtree below the prefix
+        ids: Set[str] = set()
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            for key, value in n.items():
+                if key is _LEAF:
+                    ids |= value
+                else:
+                    stack.append(value)
+        return ids
+
+
+_trie: Optional[Trie] = None
+_lock = threading.Lock()
+
+
+def _index_tokens(trie: Trie, member_id: str, name: str) -> None:
+    mid = str(member_id).lower()
+    trie.insert(mid, member_id)
+    for token in (name or "").lower().split():
+        trie.insert(token, member_id)
+
+
+def _get_trie() -> Trie:
+    """Returns the trie, building it from the member index on first use."""
+    global _trie
+    with _lock:
+        if _trie is None:
+            trie = Trie()
+            for mid, name in index_db.all_members():
+                _index_tokens(trie, mid, name)
+            _trie = trie
+        return _trie
+
+
+def lookup(prefix: str) -> Set[str]:
+    """Member ids whose id or a name word starts with `prefix`."""
+    if not prefix:
+        return set()
+    return _get_trie().prefix_ids(prefix.lower())
+
+
+def add_member(member_id: str, name: str) -> None:
+    """Indexes a newly saved member without a full rebuild."""
+    with _lock:
+        if _trie is not None:
+            _index_tokens(_trie, member_id, name)
+
+
+def invalidate() -> None:
+    """Drops the trie; the next lookup rebuilds it from the index."""
+    global _trie
+    with _lock:
+        _trie = None
@@ -1,11 +1,93 @@
+import functools
+import json
+import os
+import re
 from pathlib import Path
-from typing import Optional, Dict, Any
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
-from PyPDF2 import PdfReader
+from typing import Optional, Dict, Any, Union
 import config
 from services.file_manager import ensure_folder
 
+# reportlab and PyPDF2 are imported on first use: each pulls in dozens
+# of modules, and index-only operations (monthly list, deletes, sidecar
+# reads) never touch them. Cached in module globals after the first call.
+_canvas = None
+_A4 = None
+_PdfReader = None
+
+
+def _load_reportlab():
+    global _canvas, _A4
+    if _canvas is None:
+        from reportlab.pdfgen import canvas
+        from reportlab.lib.pagesizes import A4
+        _canvas, _A4 = canvas, A4
+    return _canvas, _A4
+
+
+def _load_pdf_reader():
+    global _PdfReader
+    if _PdfReader is None:
+        from PyPDF2 import PdfReader
+        _PdfReader = PdfReader
+    return _PdfReader
+
+# Every labelled line create_member_pdf draws, captured in one
+# multiline pass instead of testing each line against each prefix
+_FIELD_RE = re.compile(
+    r'^(Id|Name|Phone|Blood|Gender|Cnic|Package|Join Date|Membership|End Date|Status):\s*(.*)$',
+    re.MULTILINE | re.IGNORECASE,
+)
+
+
+def _store_as(key):
+    """Handler that stores the captured value verbatim under `key`."""
+    def setter(d, value):
+        d[key] = value
+    return setter
+
+
+def _store_join_date(d, value):
+    try:
+        parts = value.split("/")
+        d["day"], d["month"], d["year"] = int(parts[0]), int(parts[1]), int(parts[2])
+    except (IndexError, ValueError):
+        pass
+
+
+def _store_membership(d, value):
+    try:
+        # Extracts "3" from "3 months"
+        d["membership_months"] = int(value.split()[0])
+    except (IndexError, ValueError):
+        pass
+
+
+# Lowercased field label -> normalizer writing into the result dict
+_FIELD_HANDLERS = {
+    **{k: _store_as(k) for k in ("id", "name", "phone", "blood", "gender", "cnic", "package")},
+    "join date": _store_join_date,
+    "membership": _store_membership,
+    "end date": _store_as("end_date"),
+    "status": _store_as("status"),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _footer_lines() -> tuple:
+    """
+    The footer (creator credit + social links) is identical on every
+    card, so its positions and strings are computed once per process
+    instead of re-reading config and re-formatting per member.
+    """
+    creator = getattr(config, 'CREATOR_NAME', 'Admin')
+    lines = [(60, 70, f"Created by: {creator}")]
+
+    socials = getattr(config, 'SOCIALS', {})
+    for i, (n, u) in enumerate(socials.items()):
+        lines.append((60, 55 - i * 12, f"{n}: {u}"))
+
+    return tuple(lines)
+
 
 def create_member_pdf(save_path: Path, member_dict: Dict[str, Any]) -> None:
     """
@@ -16,6 +98,7 @@ def create_member_pdf(save_path: Path, member_dict: Dict[str, Any]) -> None:
         member_dict (dict): A dictionary containing member details (name, id, package, etc).
     """
     ensure_folder(save_path.parent)
+    canvas, A4 = _load_reportlab()
     c = canvas.Canvas(str(save_path), pagesize=A4)
     w, h = A4
     y = h - 50
@@ -60,26 +143,62 @@ def create_member_pdf(save_path: Path, member_dict: Dict[str, Any]) -> None:
     y -= 30
     c.setFont("Helvetica-Oblique", 9)
     c.setFillColorRGB(0.3, 0.3, 0.3)
-    
-    # Safe access to config in case variables are missing
-    creator = getattr(config, 'CREATOR_NAME', 'Admin')
-    c.drawString(60, 70, f"Created by: {creator}")
 
-    # Social Links
-    socials = getattr(config, 'SOCIALS', {})
-    for i, (n, u) in enumerate(socials.items()):
-        c.drawString(60, 55 - i * 12, f"{n}: {u}")
+    for fx, fy, line in _footer_lines():
+        c.drawString(fx, fy, line)
 
     c.save()
 
+    # Sidecar with the same fields: reads become a json.load instead of
+    # round-tripping structured data through rendered PDF glyphs
+    json_path = save_path.with_suffix(".json")
+    try:
+        json_path.write_text(
+            json.dumps(member_dict, default=str, ensure_ascii=False),
+            encoding="utf-8"
+        )
+    except OSError as e:
+        print(f"Could not write sidecar {json_path}: {e}")
 
-def parse_member_from_pdf(pdf_path: Path) -> Optional[Dict[str, Any]]:
+
+def parse_member_from_pdf(pdf_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
     """
     Reads a generated PDF and extracts member data back into a dictionary.
     Useful for reconstructing the database from files.
+    Results are memoized per (path, mtime, size), so re-reading an
+    unchanged record — common when a scan and a "best match" hit the
+    same file — skips text extraction entirely.
     """
+    pdf_path = Path(pdf_path)
+    try:
+        st = os.stat(pdf_path)
+    except OSError:
+        return None
+
+    data = _parse_cached(str(pdf_path), st.st_mtime_ns, st.st_size)
+    # Shallow copy so callers adding keys (photo_path) don't poison the cache
+    return dict(data) if data is not None else None
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_cached(path_str: str, mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
+    # mtime_ns and size are part of the signature purely as cache keys:
+    # a rewritten PDF gets a fresh entry, the stale one ages out of the LRU.
+    pdf_path = Path(path_str)
+
+    # Fast path: the JSON sidecar written alongside every record since
+    # sidecars were introduced. Legacy PDFs fall through to extraction.
+    try:
+        data = json.loads(pdf_path.with_suffix(".json").read_text(encoding="utf-8"))
+        if isinstance(data, dict):
+            if not data.get("id"):
+                data["id"] = pdf_path.stem
+            return data
+    except (OSError, ValueError):
+        pass
+
     try:
-        reader = PdfReader(str(pdf_path))
+        reader = _load_pdf_reader()(str(pdf_path))
         text = "".join(p.extract_text() or "" for p in reader.pages)
     except Exception:
         return None
@@ -88,50 +207,13 @@ def parse_member_from_pdf(pdf_path: Path) -> Optional[Dict[str, Any]]:
     d = {k: "" for k in ["id", "name", "phone", "blood", "gender", "cnic", "package"]}
     d.update({"day": None, "month": None, "year": None})
 
-    for ln in text.splitlines():
-        # Standard Fields
-        for key in ["id", "name", "phone", "blood", "gender", "cnic"]:
-            if ln.lower().startswith(f"{key}:"):
-                try:
-                    d[key] = ln.split(":", 1)[1].strip()
-                except IndexError:
-                    pass
-
-        # Parse Package
-        if ln.startswith("Package:"):
-            try:
-                d["package"] = ln.split(":", 1)[1].strip()
-            except IndexError:
-                pass
-
-        # Parse Join Date
-        if ln.startswith("Join Date:"):
-            try:
-                parts = ln.split(":")[1].strip().split("/")
-                d["day"], d["month"], d["year"] = int(parts[0]), int(parts[1]), int(parts[2])
-            except (IndexError, ValueError):
-                pass
-
-        # Parse Membership Duration
-        if ln.startswith("Membership:"):
-            try:
-                # Extracts "3" from "Membership: 3 months"
-                d["membership_months"] = int(ln.split(":")[1].strip().split()[0])
-            except (IndexError, ValueError):
-                pass
-
-        # Parse Dates & Status
-        if ln.startswith("End Date:"):
-            try:
-                d["end_date"] = ln.split(":", 1)[1].strip()
-            except IndexError:
-                pass
-
-        if ln.startswith("Status:"):
-            try:
-                d["status"] = ln.split(":", 1)[1].strip()
-            except IndexError:
-                pass
+    # One compiled-regex pass finds the labelled lines; each captured
+    # value is routed through the dispatch table — a dict lookup per
+    # field instead of a chain of conditionals
+    for key, val in _FIELD_RE.findall(text):
+        handler = _FIELD_HANDLERS.get(key.lower())
+        if handler:
+            handler(d, val.strip())
 
     # Fallback: If ID wasn't found in text, use filename
     if not d.get("id"):
@@ -0,0 +1,96 @@
+from typing import Callable, List, Optional, Sequence, Tuple
+from PySide6 import QtWidgets, QtCore, QtGui
+
+
+class RowModel(QtCore.QAbstractTableModel):
+    """
+    Read-only table model over a plain list of row tuples.
+    Cells are stringified lazily in data(), so refreshing a table is one
+    list swap plus a model reset instead of allocating a
+    QTableWidgetItem (and possibly a cell widget) per cell.
+    """
+    def __init__(self, headers: Sequence[str], rows: Optional[List[Sequence]] = None, parent=None):
+        super().__init__(parent)
+        self.headers = list(headers)
+        self.rows: List[Sequence] = list(rows) if rows else []
+
+    def set_rows(self, rows: List[Sequence]) -> None:
+        """Replaces the backing rows and refreshes every attached view."""
+        self.beginResetModel()
+        self.rows = list(rows)
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and index.isValid():
+            row = self.rows[index.row()]
+            col = index.column()
+            if col < len(row):
+                return str(row[col])
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+
+class ActionDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Paints button-like actions inside one column and dispatches clicks,
+    replacing the per-row QPushButton cell widgets the old QTableWidget
+    pages allocated.
+
+    Args:
+        actions: (label, background color, callback) triples; callbacks
+            receive the clicked row's tuple from the RowModel.
+        enabled_fn: optional row -> bool; rows where it returns False
+            show a grey "(Protected)" marker and ignore clicks.
+    """
+    def __init__(self,
+                 actions: Sequence[Tuple[str, str, Callable]],
+                 parent=None,
+                 enabled_fn: Optional[Callable] = None):
+        super().__init__(parent)
+        self.actions = list(actions)
+        self.enabled_fn = enabled_fn
+
+    def _slots(self, option) -> List[QtCore.QRect]:
+        """Splits the cell rect evenly, one slot per action."""
+        r = option.rect
+        w = r.width() // len(self.actions)
+        return [QtCore.QRect(r.x() + i * w, r.y(), w, r.height())
+                for i in range(len(self.actions))]
+
+    def paint(self, painter, option, index) -> None:
+        row = index.model().rows[index.row()]
+
+        if self.enabled_fn and not self.enabled_fn(row):
+            painter.save()
+            painter.setPen(QtGui.QColor("#777"))
+            painter.drawText(option.rect, QtCore.Qt.AlignCenter, "(Protected)")
+            painter.restore()
+            return
+
+        for (label, bg, _cb), rect in zip(self.actions, self._slots(option)):
+            painter.save()
+            painter.fillRect(rect.adjusted(2, 2, -2, -2), QtGui.QColor(bg))
+            painter.setPen(QtGui.QColor("white"))
+            painter.drawText(rect, QtCore.Qt.AlignCenter, label)
+            painter.restore()
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        if event.type() == QtCore.QEvent.MouseButtonRelease:
+            row = model.rows[index.row()]
+            if self.enabled_fn and not self.enabled_fn(row):
+                return False
+            for (_label, _bg, callback), rect in zip(self.actions, self._slots(option)):
+                if rect.contains(event.pos()):
+                    callback(row)
+                    return True
+        return False
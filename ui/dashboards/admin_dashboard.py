@@ -1,28 +1,32 @@
-import shutil
 import datetime
 import os
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 from PySide6 import QtWidgets, QtCore, QtGui
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
 
 import config
 from core.utils import add_months, month_name
 from models.member import Member
 
 # Workers
-from workers.save_worker import SaveWorker
 from workers.search_worker import SearchWorker
-from workers.report_worker import MonthlyListWorker, StatusListWorker
+from workers.report_worker import CallableWorker
+from workers.checkin_worker import CheckInWorker
+from workers.fetch_worker import TableFetchWorker
+from workers.photo_worker import PhotoLoadWorker
+from workers.export_worker import ExportWorker
+from workers.pools import SEARCH_POOL, IO_POOL
 
 # Services
 from services.analytics_service import generate_daily_brief
-from services.attendance_service import mark_attendance
+from services.file_manager import ingest_photo
 from services.member_service import (
-    get_member_by_id, renew_membership, get_pending_members, 
-    update_member_status, delete_member
+    get_member_by_id, renew_membership, get_pending_members,
+    update_member_status, delete_member, find_photo, invalidate_photo_cache,
+    save_new_member, get_monthly_list, get_members_by_status
 )
 from services.auth_service import (
     create_user, get_all_users, delete_user_by_id, update_user
@@ -30,11 +34,39 @@ from services.auth_service import (
 from services.finance_service import get_fee_logs
 from ai_module.analytics import GymAI
 
+# Components
+from ui.components.table_models import RowModel, ActionDelegate
+
 # Dialogs
 from ui.dialogs.backup_dialog import BackupDialog
 from ui.dialogs.renew_dialog import RenewDialog
 from ui.dialogs.camera_dialog import CameraDialog
 
+# One consolidated sheet, built once at import: widgets opt in via
+# setObjectName, so Qt parses the CSS a single time per process
+ADMIN_QSS = """
+    QMainWindow{background:#0c0c0c;color:white}
+    QLineEdit,QComboBox,QSpinBox,QTextEdit{padding:8px;background:#222;color:white;border:1px solid #444}
+    QPushButton{background:#333;color:white;padding:8px}
+    QPushButton:hover{background:#fc0;color:black}
+    QPushButton#primary{background:#0044cc;font-weight:bold}
+    QPushButton#camera{background:#0044cc;color:white}
+    QPushButton#success{background:#006600}
+    QPushButton#backup{background:#006600;font-weight:bold}
+    QPushButton#gold{background:#d4af37;color:black;font-weight:bold}
+    QPushButton#danger{background:#500;color:white;font-weight:bold;border:1px solid red}
+    QWidget#sidebar{border-right:2px solid #333;background:#111}
+    QLabel#photoBox{border:2px solid #444;background:black}
+    QLabel#checkinPhoto{border:3px solid #333;background:black}
+    QLabel#checkinName{font-size:20px;font-weight:bold;color:#fc0}
+    QLabel#checkinPkg{font-size:14px;color:#ddd}
+    QLabel#checkinExp{font-size:14px;color:#aaa}
+    QLabel#aiLine{color:#0af}
+    QLabel#badge{background:#333;font-weight:bold;padding:5px}
+    QHeaderView::section{background-color:#333;color:white;padding:5px}
+    QTableView{gridline-color:#444}
+"""
+
 
 class AdminDashboard(QtWidgets.QMainWindow):
     """
@@ -44,16 +76,49 @@ class AdminDashboard(QtWidgets.QMainWindow):
     logout_signal = QtCore.Signal()
     member_saved = QtCore.Signal()
 
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("💪 SOLID GYM — Admin Dashboard")
         self.resize(1400, 900)
-        
-        # ThreadPool for background tasks (Search, Save, etc.)
-        self.pool = QtCore.QThreadPool()
-        self.pool.setMaxThreadCount(4)
-        
+
         self.current_photo_path: Optional[str] = None
+        self._photos_folder_ready = False
+
+        # Last member dict delivered by the search worker; open_renew
+        # and do_ban reuse it instead of re-reading the record
+        self._last_member: Optional[Dict[str, Any]] = None
+
+        # Query currently being searched; repeat triggers for the same
+        # text (scanner bounce, double-click) are dropped until it lands
+        self._search_inflight: Optional[str] = None
+
+        # Monotonic search counter: workers made stale by a newer query
+        # short-circuit before touching the database (see SearchWorker)
+        self._search_gen = 0
+
+        # Dialogs are built once on first use and reused afterwards
+        self._file_dlg: Optional[QtWidgets.QFileDialog] = None
+        self._renew_dlg: Optional[RenewDialog] = None
+        self._cam_dlg: Optional[CameraDialog] = None
+
+        # GymAI is created once and its peak-hour line cached for a
+        # minute so check-in scans don't pay analytics per swipe
+        self._ai: Optional[GymAI] = None
+        self._ai_ts = 0.0
+        self._ai_cached_text = ""
+
+        # Decoded photo pixmaps keyed by (path, mtime, size); repeat
+        # displays of the same member skip the JPEG decode + rescale
+        self._pix_cache: OrderedDict = OrderedDict()
+
+        # Which cache key each photo label is waiting on, so a slow
+        # decode can't overwrite a newer photo on the same label
+        self._photo_targets: Dict[QtWidgets.QLabel, tuple] = {}
+
+        # Which key each label currently displays; re-searching the same
+        # member becomes a no-op instead of a decode + repaint
+        self._photo_current: Dict[QtWidgets.QLabel, tuple] = {}
 
         self.init_ui()
         self.apply_style()
@@ -100,7 +165,7 @@ class AdminDashboard(QtWidgets.QMainWindow):
         sidebar.addWidget(self.b_brief)
         
         self.b_bkp = QtWidgets.QPushButton("☁️ Cloud Backup")
-        self.b_bkp.setStyleSheet("background:#006600;font-weight:bold")
+        self.b_bkp.setObjectName("backup")
         self.b_bkp.clicked.connect(self.open_backup)
         sidebar.addWidget(self.b_bkp)
 
@@ -112,54 +177,87 @@ class AdminDashboard(QtWidgets.QMainWindow):
         sw = QtWidgets.QWidget()
         sw.setLayout(sidebar)
         sw.setMaximumWidth(250)
-        sw.setStyleSheet("border-right:2px solid #333;background:#111")
+        sw.setObjectName("sidebar")
         layout.addWidget(sw)
 
         # --- CONTENT AREA (Stacked Widget) ---
         self.stacked = QtWidgets.QStackedWidget()
         layout.addWidget(self.stacked, 1)
         
+        # The member page is the landing page (and Monthly/Export read
+        # its date pickers), so it is built eagerly; every other page is
+        # an empty placeholder until the user first navigates to it
         self.p_mem = QtWidgets.QWidget()
         self.init_member_page()
         self.stacked.addWidget(self.p_mem)
-        
+
         self.p_app = QtWidgets.QWidget()
-        self.init_approval_page()
-        self.stacked.addWidget(self.p_app)
-        
         self.p_att = QtWidgets.QWidget()
-        self.init_attendance_page()
-        self.stacked.addWidget(self.p_att)
-        
         self.p_fees = QtWidgets.QWidget()
-        self.init_fees_page()
-        self.stacked.addWidget(self.p_fees)
-        
         self.p_usr = QtWidgets.QWidget()
-        self.init_user_page()
-        self.stacked.addWidget(self.p_usr)
-        
         self.p_act = QtWidgets.QWidget()
-        self.init_status_page(self.p_act, "Active")
-        self.stacked.addWidget(self.p_act)
-        
         self.p_die = QtWidgets.QWidget()
-        self.init_status_page(self.p_die, "Expired")
-        self.stacked.addWidget(self.p_die)
-
-        # Navigation Signals
-        self.b_mem.clicked.connect(lambda: self.stacked.setCurrentWidget(self.p_mem))
-        self.b_app.clicked.connect(lambda: [self.stacked.setCurrentWidget(self.p_app), self.load_approvals()])
-        self.b_att.clicked.connect(lambda: self.stacked.setCurrentWidget(self.p_att))
-        self.b_fees.clicked.connect(lambda: [self.stacked.setCurrentWidget(self.p_fees), self.load_fee_table()])
-        self.b_usr.clicked.connect(lambda: [self.stacked.setCurrentWidget(self.p_usr), self.load_users_table()])
-        self.b_act.clicked.connect(lambda: self.load_status_page(self.p_act, "Active"))
-        self.b_die.clicked.connect(lambda: self.load_status_page(self.p_die, "Expired"))
+
+        for p in (self.p_app, self.p_att, self.p_fees, self.p_usr, self.p_act, self.p_die):
+            self.stacked.addWidget(p)
+
+        self._builders = {
+            self.p_app: self.init_approval_page,
+            self.p_att: self.init_attendance_page,
+            self.p_fees: self.init_fees_page,
+            self.p_usr: self.init_user_page,
+            self.p_act: lambda: self.init_status_page(self.p_act, "Active"),
+            self.p_die: lambda: self.init_status_page(self.p_die, "Expired"),
+        }
+
+        # Navigation Signals — named slots, no per-click closures
+        self.b_mem.clicked.connect(self._goto_members)
+        self.b_app.clicked.connect(self._goto_approvals)
+        self.b_att.clicked.connect(self._goto_attendance)
+        self.b_fees.clicked.connect(self._goto_fees)
+        self.b_usr.clicked.connect(self._goto_users)
+        self.b_act.clicked.connect(self._goto_active)
+        self.b_die.clicked.connect(self._goto_expired)
         self.b_mon.clicked.connect(self.monthly)
         self.b_exp.clicked.connect(self.export_pdf)
-        
+
         # Refresh lists when a member is saved
-        self.member_saved.connect(lambda: self.load_status_page(self.p_act, "Active"))
+        self.member_saved.connect(self._goto_active)
+
+    # --- NAVIGATION ---
+    def _ensure_page(self, page: QtWidgets.QWidget) -> None:
+        """Builds a placeholder page on first visit, then forgets it."""
+        builder = self._builders.pop(page, None)
+        if builder:
+            builder()
+
+    def _goto_members(self) -> None:
+        self.stacked.setCurrentWidget(self.p_mem)
+
+    def _goto_approvals(self) -> None:
+        self._ensure_page(self.p_app)
+        self.stacked.setCurrentWidget(self.p_app)
+        self.load_approvals()
+
+    def _goto_attendance(self) -> None:
+        self._ensure_page(self.p_att)
+        self.stacked.setCurrentWidget(self.p_att)
+
+    def _goto_fees(self) -> None:
+        self._ensure_page(self.p_fees)
+        self.stacked.setCurrentWidget(self.p_fees)
+        self.load_fee_table()
+
+    def _goto_users(self) -> None:
+        self._ensure_page(self.p_usr)
+        self.stacked.setCurrentWidget(self.p_usr)
+        self.load_users_table()
+
+    def _goto_active(self) -> None:
+        self.load_status_page(self.p_act, "Active")
+
+    def _goto_expired(self) -> None:
+        self.load_status_page(self.p_die, "Expired")
 
     # --- MEMBER MANAGEMENT ---
     def init_member_page(self) -> None:
@@ -169,7 +267,7 @@ class AdminDashboard(QtWidgets.QMainWindow):
         top = QtWidgets.QHBoxLayout()
         self.ph_lbl = QtWidgets.QLabel("📷 No Photo")
         self.ph_lbl.setFixedSize(150, 150)
-        self.ph_lbl.setStyleSheet("border:2px solid #444;background:black")
+        self.ph_lbl.setObjectName("photoBox")
         self.ph_lbl.setAlignment(QtCore.Qt.AlignCenter)
 
         # Photo Buttons
@@ -178,7 +276,7 @@ class AdminDashboard(QtWidgets.QMainWindow):
         b1.clicked.connect(self.upl)
 
         b_cam = QtWidgets.QPushButton("📷 Take Photo")
-        b_cam.setStyleSheet("background: #0044cc; color: white;")
+        b_cam.setObjectName("camera")
         b_cam.clicked.connect(self.take_photo)
 
         b2 = QtWidgets.QPushButton("🗑️ Clear")
@@ -197,15 +295,15 @@ class AdminDashboard(QtWidgets.QMainWindow):
         self.id.setPlaceholderText("ID to Search/Add")
         
         b_src = QtWidgets.QPushButton("🔍 Search ID")
-        b_src.setStyleSheet("background:#0044cc;font-weight:bold")
+        b_src.setObjectName("primary")
         b_src.clicked.connect(self.on_search)
         
         self.b_renew = QtWidgets.QPushButton("💰 Update Fee")
-        self.b_renew.setStyleSheet("background:#d4af37;color:black;font-weight:bold")
+        self.b_renew.setObjectName("gold")
         self.b_renew.clicked.connect(self.open_renew)
         
         self.b_ban = QtWidgets.QPushButton("🚫 TERMINATE")
-        self.b_ban.setStyleSheet("background:#500;color:white;font-weight:bold;border:1px solid red")
+        self.b_ban.setObjectName("danger")
         self.b_ban.clicked.connect(self.do_ban)
         
         h_search.addWidget(self.id)
@@ -260,7 +358,7 @@ class AdminDashboard(QtWidgets.QMainWindow):
 
         # Form Actions
         bS = QtWidgets.QPushButton("💾 Save (Create / Update All)")
-        bS.setStyleSheet("background:#006600")
+        bS.setObjectName("success")
         bS.clicked.connect(self.on_save)
         
         bC = QtWidgets.QPushButton("🧹 Clear")
@@ -275,7 +373,8 @@ class AdminDashboard(QtWidgets.QMainWindow):
         # Search Result Display
         self.res_badge = QtWidgets.QLabel("STATUS")
         self.res_badge.setAlignment(QtCore.Qt.AlignCenter)
-        self.res_badge.setStyleSheet("background:#333;font-weight:bold;padding:5px")
+        self.res_badge.setTextFormat(QtCore.Qt.RichText)
+        self.res_badge.setObjectName("badge")
         layout.addWidget(self.res_badge)
         
         self.res = QtWidgets.QTextEdit()
@@ -283,6 +382,72 @@ class AdminDashboard(QtWidgets.QMainWindow):
         self.res.setMaximumHeight(100)
         layout.addWidget(self.res)
 
+    @staticmethod
+    def _photo_key(path: str, w: int, h: int) -> tuple:
+        """Cache key for a photo: a re-captured file changes its mtime."""
+        try:
+            st = os.stat(path)
+            return (path, st.st_mtime_ns, w, h)
+        except OSError:
+            return (path, 0, w, h)
+
+    def _set_photo(self, label: QtWidgets.QLabel, path: str, w: int, h: int) -> None:
+        """
+        Shows a photo on a label, decoding off the GUI thread.
+        Cached pixmaps (per path, mtime and size) are set synchronously;
+        misses go through PhotoLoadWorker, which has libjpeg decode the
+        image already scaled instead of decompressing a full camera
+        frame on the GUI thread. The LRU keeps at most 64 decoded images.
+        """
+        key = self._photo_key(path, w, h)
+        if self._photo_current.get(label) == key:
+            return
+
+        pm = self._pix_cache.get(key)
+        if pm is not None:
+            self._pix_cache.move_to_end(key)
+            label.setPixmap(pm)
+            self._photo_current[label] = key
+            return
+
+        self._photo_targets[label] = key
+        worker = PhotoLoadWorker(path, w, h)
+        worker.signals.finished.connect(
+            lambda img, lbl=label, k=key: self._photo_ready(lbl, k, img)
+        )
+        worker.signals.error.connect(
+            lambda _msg, lbl=label, k=key: self._photo_failed(lbl, k)
+        )
+        SEARCH_POOL.start(worker)
+
+    def _cache_pixmap(self, key: tuple, img: QtGui.QImage) -> QtGui.QPixmap:
+        pm = QtGui.QPixmap.fromImage(img)
+        self._pix_cache[key] = pm
+        if len(self._pix_cache) > 64:
+            self._pix_cache.popitem(last=False)
+        return pm
+
+    def _photo_ready(self, label: QtWidgets.QLabel, key: tuple, img: QtGui.QImage) -> None:
+        pm = self._cache_pixmap(key, img)
+
+        # Only set the pixmap if the label still wants this photo
+        if self._photo_targets.get(label) == key:
+            label.setPixmap(pm)
+            self._photo_current[label] = key
+            del self._photo_targets[label]
+
+    def _photo_failed(self, label: QtWidgets.QLabel, key: tuple) -> None:
+        """
+        Decode failed (missing or corrupt file): show the "No Photo"
+        placeholder rather than leaving whatever photo the label held
+        before — on the check-in card that was the previous member.
+        """
+        if self._photo_targets.get(label) == key:
+            del self._photo_targets[label]
+            self._photo_current.pop(label, None)
+            label.clear()
+            label.setText("No Photo")
+
     def do_ban(self) -> None:
         mid = self.id.text().strip()
         if not mid: 
@@ -295,6 +460,7 @@ class AdminDashboard(QtWidgets.QMainWindow):
         ) == QtWidgets.QMessageBox.Yes:
             try:
                 update_member_status(mid, "BANNED")
+                self._last_member = None
                 QtWidgets.QMessageBox.information(self, "Terminated", f"Member {mid} Banned.")
                 self.on_search()
             except Exception as e:
@@ -310,17 +476,24 @@ class AdminDashboard(QtWidgets.QMainWindow):
             
             # Handle Photo Copying
             if self.current_photo_path and os.path.exists(self.current_photo_path):
-                if not config.PHOTOS_FOLDER.exists():
+                if not self._photos_folder_ready:
                     config.PHOTOS_FOLDER.mkdir(parents=True, exist_ok=True)
-                    
+                    self._photos_folder_ready = True
+
                 dest = config.PHOTOS_FOLDER / f"{clean_id}{Path(self.current_photo_path).suffix}"
-                
-                # Only copy if it's not already in the destination
-                if Path(self.current_photo_path).resolve() != dest.resolve():
-                    shutil.copy2(self.current_photo_path, dest)
-                    
+
+                # Only copy if it's not already in the destination —
+                # samefile is one stat pair vs. resolve()'s path walks
+                try:
+                    same = os.path.samefile(self.current_photo_path, dest)
+                except OSError:
+                    same = False
+                if not same:
+                    ingest_photo(self.current_photo_path, dest)
+                    invalidate_photo_cache()
+
                 pp = str(dest)
-                self.current_photo_path = pp 
+                self.current_photo_path = pp
 
             # Calculate Dates
             jd = datetime.date(int(self.yy.currentText()), int(self.mm.currentText()), self.dd.value())
@@ -350,54 +523,67 @@ class AdminDashboard(QtWidgets.QMainWindow):
                 photo_path=pp
             )
             
-            w = SaveWorker(m)
+            w = CallableWorker(save_new_member, m)
             w.signals.finished.connect(self._saved)
-            self.pool.start(w)
+            IO_POOL.start(w)
             
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Error", str(e))
 
     def _saved(self, path: str) -> None:
+        self._last_member = None
         QtWidgets.QMessageBox.information(self, "Success", f"Saved: {path}")
         self.member_saved.emit()
         
         # Refresh photo display
         if self.current_photo_path:
-            self.ph_lbl.setPixmap(
-                QtGui.QPixmap(self.current_photo_path).scaled(150, 150, QtCore.Qt.KeepAspectRatio)
-            )
+            self._set_photo(self.ph_lbl, self.current_photo_path, 150, 150)
 
     def on_search(self) -> None:
         self.stacked.setCurrentWidget(self.p_mem)
         q = self.id.text().strip() or self.nm.text().strip()
-        if not q: 
+        if not q:
             return
-            
-        w = SearchWorker(q, is_admin=True)
+
+        if self._search_inflight == q:
+            return
+        self._search_inflight = q
+
+        self._search_gen += 1
+        w = SearchWorker(q, is_admin=True,
+                         generation=self._search_gen,
+                         token_ref=lambda: self._search_gen)
         w.signals.finished.connect(self._found)
-        self.pool.start(w)
+        SEARCH_POOL.start(w)
 
     def _found(self, d: dict) -> None:
-        if not d.get("matches"): 
+        self._search_inflight = None
+        if not d.get("matches"):
+            self._last_member = None
             self.res.setPlainText("Not found")
             self.res_badge.setText("UNKNOWN")
-            self.res_badge.setStyleSheet("background:#333")
             return
             
         p = d.get("parsed")
         if p:
+            self._last_member = p
             st = p.get('status', 'Expired')
-            self.res.setPlainText(f"Found: {p.get('name')}\nStatus: {st}\nExpires: {p.get('end_date')}")
-            
+
             # Badge Color Logic
             c = "green" if st.lower() == "active" else "red"
             if st.lower() == "banned":
                 c = "red"
             elif st.lower() == "pending":
                 c = "orange"
-                
-            self.res_badge.setText(f"{'✅' if c == 'green' else '❌'} {st.upper()}")
-            self.res_badge.setStyleSheet(f"background:{c};color:white;font-weight:bold;padding:5px")
+
+            # One rich-text update instead of setPlainText + setText +
+            # setStyleSheet, each of which forces its own layout pass
+            self.res.clear()
+            self.res_badge.setText(
+                f"<b>{p.get('name')}</b> &nbsp; "
+                f"<span style='color:{c}'>{'✅' if c == 'green' else '❌'} {st.upper()}</span>"
+                f" &nbsp; Expires: {p.get('end_date')}"
+            )
             
             # Fill Form
             self.id.setText(p.get('id'))
@@ -409,12 +595,11 @@ class AdminDashboard(QtWidgets.QMainWindow):
             # Load Photo
             if p.get('photo_path') and Path(p['photo_path']).exists():
                 self.current_photo_path = p['photo_path']
-                self.ph_lbl.setPixmap(
-                    QtGui.QPixmap(p['photo_path']).scaled(150, 150, QtCore.Qt.KeepAspectRatio)
-                )
+                self._set_photo(self.ph_lbl, p['photo_path'], 150, 150)
             else:
                 self.ph_lbl.clear()
                 self.ph_lbl.setText("No Photo")
+                self._photo_current.pop(self.ph_lbl, None)
                 self.current_photo_path = None
 
     def open_renew(self) -> None:
@@ -423,10 +608,23 @@ class AdminDashboard(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.warning(self, "Error", "Search for an ID first")
             return
             
-        d = get_member_by_id(mid)
-        exp = d.get('end_date', '') if d else None
-        
-        dlg = RenewDialog(self, exp)
+        # The search that found this member already parsed the record
+        if self._last_member and self._last_member.get('id') == mid:
+            d = self._last_member
+        else:
+            d = get_member_by_id(mid)
+        exp_str = d.get('end_date') if d else None
+        try:
+            exp = datetime.date.fromisoformat(exp_str) if exp_str else None
+        except ValueError:
+            exp = None
+
+        if self._renew_dlg is None:
+            self._renew_dlg = RenewDialog(self, exp)
+        else:
+            self._renew_dlg.reset(exp)
+
+        dlg = self._renew_dlg
         if dlg.exec() == QtWidgets.QDialog.Accepted:
             data = dlg.result_data
             try:
@@ -441,46 +639,36 @@ class AdminDashboard(QtWidgets.QMainWindow):
         l = QtWidgets.QVBoxLayout(self.p_app)
         l.addWidget(QtWidgets.QLabel("🔔 Pending Member Approvals"))
         
-        self.app_table = QtWidgets.QTableWidget()
-        self.app_table.setColumnCount(5)
-        self.app_table.setHorizontalHeaderLabels(["ID", "Name", "Gender", "Join Date", "Action"])
+        self.app_model = RowModel(["ID", "Name", "Gender", "Join Date", "Action"])
+        self.app_table = QtWidgets.QTableView()
+        self.app_table.setModel(self.app_model)
         self.app_table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
-        self.app_table.setStyleSheet(
-            "QHeaderView::section { background-color: #333; color: white; padding: 5px; } "
-            "QTableWidget { gridline-color: #444; }"
+
+        # Action column is painted by the delegate — no per-row buttons
+        self._app_delegate = ActionDelegate(
+            [("✅ Approve", "#006600", lambda row: self.do_approve(row[0])),
+             ("🗑️ Reject", "#b71c1c", lambda row: self.do_reject(row[0]))],
+            parent=self.app_table,
         )
-        
+        self.app_table.setItemDelegateForColumn(4, self._app_delegate)
+
+
         btn_refresh = QtWidgets.QPushButton("🔄 Refresh List")
         btn_refresh.clicked.connect(self.load_approvals)
         l.addWidget(self.app_table)
         l.addWidget(btn_refresh)
 
     def load_approvals(self) -> None:
-        self.app_table.setRowCount(0)
-        pending = get_pending_members()
-        
-        for i, m in enumerate(pending):
-            self.app_table.insertRow(i)
-            self.app_table.setItem(i, 0, QtWidgets.QTableWidgetItem(str(m['id'])))
-            self.app_table.setItem(i, 1, QtWidgets.QTableWidgetItem(str(m['name'])))
-            self.app_table.setItem(i, 2, QtWidgets.QTableWidgetItem(str(m.get('gender', '-'))))
-            self.app_table.setItem(i, 3, QtWidgets.QTableWidgetItem(str(m['date'])))
-            
-            w = QtWidgets.QWidget()
-            h = QtWidgets.QHBoxLayout(w)
-            h.setContentsMargins(0, 0, 0, 0)
-            
-            b_ok = QtWidgets.QPushButton("✅ Approve")
-            b_ok.setStyleSheet("background: #006600; font-size:11px;")
-            b_ok.clicked.connect(lambda c, x=m['id']: self.do_approve(x))
-            
-            b_no = QtWidgets.QPushButton("🗑️ Reject")
-            b_no.setStyleSheet("background: #b71c1c; font-size:11px;")
-            b_no.clicked.connect(lambda c, x=m['id']: self.do_reject(x))
-            
-            h.addWidget(b_ok)
-            h.addWidget(b_no)
-            self.app_table.setCellWidget(i, 4, w)
+        w = TableFetchWorker(get_pending_members)
+        w.signals.finished.connect(self._populate_approvals)
+        SEARCH_POOL.start(w)
+
+    def _populate_approvals(self, pending: list) -> None:
+        # One model reset repaints the whole view; cells render lazily
+        self.app_model.set_rows([
+            (m['id'], m['name'], m.get('gender', '-'), m['date'])
+            for m in pending
+        ])
 
     def do_approve(self, mid: str) -> None:
         try:
@@ -503,14 +691,10 @@ class AdminDashboard(QtWidgets.QMainWindow):
         l = QtWidgets.QVBoxLayout(self.p_fees)
         l.addWidget(QtWidgets.QLabel("💰 Fee Update History"))
         
-        self.fee_table = QtWidgets.QTableWidget()
-        self.fee_table.setColumnCount(4)
-        self.fee_table.setHorizontalHeaderLabels(["Time", "Staff Member", "Member ID", "Months Added"])
+        self.fee_model = RowModel(["Time", "Staff Member", "Member ID", "Months Added"])
+        self.fee_table = QtWidgets.QTableView()
+        self.fee_table.setModel(self.fee_model)
         self.fee_table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
-        self.fee_table.setStyleSheet(
-            "QHeaderView::section { background-color: #333; color: white; padding: 5px; } "
-            "QTableWidget { gridline-color: #444; }"
-        )
         
         btn_refresh = QtWidgets.QPushButton("🔄 Refresh Logs")
         btn_refresh.clicked.connect(self.load_fee_table)
@@ -518,15 +702,12 @@ class AdminDashboard(QtWidgets.QMainWindow):
         l.addWidget(btn_refresh)
 
     def load_fee_table(self) -> None:
-        self.fee_table.setRowCount(0)
-        logs = get_fee_logs()
-        
-        for i, data in enumerate(logs):
-            self.fee_table.insertRow(i)
-            self.fee_table.setItem(i, 0, QtWidgets.QTableWidgetItem(str(data[1])))
-            self.fee_table.setItem(i, 1, QtWidgets.QTableWidgetItem(str(data[2])))
-            self.fee_table.setItem(i, 2, QtWidgets.QTableWidgetItem(str(data[3])))
-            self.fee_table.setItem(i, 3, QtWidgets.QTableWidgetItem(str(data[4])))
+        w = TableFetchWorker(get_fee_logs)
+        w.signals.finished.connect(self._populate_fee_table)
+        SEARCH_POOL.start(w)
+
+    def _populate_fee_table(self, logs: list) -> None:
+        self.fee_model.set_rows([tuple(data[1:5]) for data in logs])
 
     # --- ATTENDANCE ---
     def init_attendance_page(self) -> None:
@@ -534,7 +715,7 @@ class AdminDashboard(QtWidgets.QMainWindow):
         l.addWidget(QtWidgets.QLabel("⏱️ Security"))
         
         self.ai_lbl = QtWidgets.QLabel("🤖 AI: Gathering...")
-        self.ai_lbl.setStyleSheet("color:#0af")
+        self.ai_lbl.setObjectName("aiLine")
         l.addWidget(self.ai_lbl)
 
         gb = QtWidgets.QGroupBox("Check-In")
@@ -545,7 +726,7 @@ class AdminDashboard(QtWidgets.QMainWindow):
         
         b = QtWidgets.QPushButton("Check In")
         b.clicked.connect(self.chk_in)
-        b.setStyleSheet("background:#006600")
+        b.setObjectName("success")
         
         hb.addWidget(self.att_in)
         hb.addWidget(b)
@@ -555,20 +736,21 @@ class AdminDashboard(QtWidgets.QMainWindow):
         v = QtWidgets.QVBoxLayout(inf)
         self.c_ph = QtWidgets.QLabel("Waiting")
         self.c_ph.setFixedSize(200, 200)
-        self.c_ph.setStyleSheet("border:3px solid #333;background:black")
+        self.c_ph.setObjectName("checkinPhoto")
 
         # Details
         self.c_nm = QtWidgets.QLabel("-")
-        self.c_nm.setStyleSheet("font-size:20px;font-weight:bold;color:#fc0")
-        
+        self.c_nm.setObjectName("checkinName")
+
         self.c_pkg = QtWidgets.QLabel("Package: -")
-        self.c_pkg.setStyleSheet("font-size:14px;color:#ddd")
-        
+        self.c_pkg.setObjectName("checkinPkg")
+
+        # Status colour changes per scan, so this one stays inline
         self.c_st = QtWidgets.QLabel("-")
         self.c_st.setStyleSheet("font-size:16px;font-weight:bold")
-        
+
         self.c_ex = QtWidgets.QLabel("Expires: -")
-        self.c_ex.setStyleSheet("font-size:14px;color:#aaa")
+        self.c_ex.setObjectName("checkinExp")
 
         hh = QtWidgets.QHBoxLayout()
         hh.addStretch()
@@ -586,14 +768,20 @@ class AdminDashboard(QtWidgets.QMainWindow):
 
     def chk_in(self) -> None:
         mid = self.att_in.text().strip()
-        if not mid: 
+        if not mid:
             return
-            
-        d = get_member_by_id(mid)
 
+        # Clear immediately so the next scan can start while this one
+        # resolves in the background
+        self.att_in.clear()
+
+        w = CheckInWorker(mid)
+        w.signals.finished.connect(self._on_check_in)
+        IO_POOL.start(w)
+
+    def _on_check_in(self, d: dict) -> None:
         if not d:
             QtWidgets.QMessageBox.warning(self, "Unknown", "ID not found")
-            self.att_in.clear()
             self.c_nm.setText("Unknown")
             self.c_st.setText("NOT FOUND")
             self.c_pkg.setText("Package: -")
@@ -612,18 +800,26 @@ class AdminDashboard(QtWidgets.QMainWindow):
         )
 
         if d.get('photo_path'):
-            self.c_ph.setPixmap(
-                QtGui.QPixmap(d['photo_path']).scaled(200, 200, QtCore.Qt.KeepAspectRatio)
-            )
+            self._set_photo(self.c_ph, d['photo_path'], 200, 200)
         else:
             self.c_ph.clear()
             self.c_ph.setText("No Photo")
+            self._photo_current.pop(self.c_ph, None)
 
-        mark_attendance(mid)
-        self.att_in.clear()
-        
-        ai = GymAI()
-        self.ai_lbl.setText(f"AI: {ai.predict_peak_hours()}")
+        # Attendance was already recorded by the worker
+        self.ai_lbl.setText(f"AI: {self._peak_hours_text()}")
+
+    def _peak_hours_text(self) -> str:
+        """Peak-hour line from a cached GymAI, refreshed at most per minute."""
+        if self._ai is None:
+            self._ai = GymAI()
+
+        now = time.monotonic()
+        if not self._ai_cached_text or now - self._ai_ts > 60:
+            self._ai_cached_text = self._ai.predict_peak_hours()
+            self._ai_ts = now
+
+        return self._ai_cached_text
 
     # --- USER MANAGEMENT ---
     def init_user_page(self) -> None:
@@ -658,35 +854,32 @@ class AdminDashboard(QtWidgets.QMainWindow):
         r = QtWidgets.QVBoxLayout(rw)
         r.addWidget(QtWidgets.QLabel("📋 Staff"))
         
-        self.ut = QtWidgets.QTableWidget()
-        self.ut.setColumnCount(5)
-        self.ut.setHorizontalHeaderLabels(["ID", "Name", "Role", "Gender", "Action"])
+        self.user_model = RowModel(["ID", "Name", "Role", "Gender", "Action"])
+        self.ut = QtWidgets.QTableView()
+        self.ut.setModel(self.user_model)
         self.ut.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
         self.ut.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
-        self.ut.cellDoubleClicked.connect(self.edit_user_click)
+        self.ut.doubleClicked.connect(self.edit_user_click)
+
+        # The built-in admin account can't be deleted from the UI
+        self._user_delegate = ActionDelegate(
+            [("Del", "#b00", lambda row: self.del_user(row[0]))],
+            parent=self.ut,
+            enabled_fn=lambda row: not (row[2] == 'admin' and row[1] == 'admin'),
+        )
+        self.ut.setItemDelegateForColumn(4, self._user_delegate)
         
         r.addWidget(self.ut)
         ml.addWidget(lw, 1)
         ml.addWidget(rw, 2)
 
     def load_users_table(self) -> None:
-        self.ut.setRowCount(0)
-        us = get_all_users()
-        
-        for i, u in enumerate(us):
-            self.ut.insertRow(i)
-            self.ut.setItem(i, 0, QtWidgets.QTableWidgetItem(str(u[0])))
-            self.ut.setItem(i, 1, QtWidgets.QTableWidgetItem(str(u[1])))
-            self.ut.setItem(i, 2, QtWidgets.QTableWidgetItem(str(u[2])))
-            self.ut.setItem(i, 3, QtWidgets.QTableWidgetItem(str(u[3])))
-            
-            if u[2] == 'admin' and u[1] == 'admin':
-                btn = QtWidgets.QLabel("(Protected)")
-            else:
-                btn = QtWidgets.QPushButton("Del")
-                btn.setStyleSheet("background:#b00")
-                btn.clicked.connect(lambda c, x=u[0]: self.del_user(x))
-            self.ut.setCellWidget(i, 4, btn)
+        w = TableFetchWorker(get_all_users)
+        w.signals.finished.connect(self._populate_users_table)
+        SEARCH_POOL.start(w)
+
+    def _populate_users_table(self, us: list) -> None:
+        self.user_model.set_rows([tuple(u[:4]) for u in us])
 
     def do_create_user(self) -> None:
         try:
@@ -702,10 +895,9 @@ class AdminDashboard(QtWidgets.QMainWindow):
             delete_user_by_id(uid)
             self.load_users_table()
 
-    def edit_user_click(self, r: int, c: int) -> None:
-        uid = self.ut.item(r, 0).text()
-        rl = self.ut.item(r, 2).text()
-        gd = self.ut.item(r, 3).text()
+    def edit_user_click(self, index: QtCore.QModelIndex) -> None:
+        row = self.user_model.rows[index.row()]
+        uid, rl, gd = str(row[0]), str(row[2]), str(row[3])
         
         d = QtWidgets.QDialog(self)
         d.setStyleSheet("background:#111;color:white")
@@ -736,26 +928,33 @@ class AdminDashboard(QtWidgets.QMainWindow):
 
     # --- UTILS ---
     def upl(self) -> None:
-        f, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self, "Photo", "", "Images (*.png *.jpg *.jpeg)"
-        )
-        if f:
+        if self._file_dlg is None:
+            self._file_dlg = QtWidgets.QFileDialog(self, "Photo")
+            self._file_dlg.setNameFilter("Images (*.png *.jpg *.jpeg)")
+            self._file_dlg.setFileMode(QtWidgets.QFileDialog.ExistingFile)
+
+        if self._file_dlg.exec():
+            f = self._file_dlg.selectedFiles()[0]
             self.current_photo_path = f
-            self.ph_lbl.setPixmap(
-                QtGui.QPixmap(f).scaled(150, 150, QtCore.Qt.KeepAspectRatio)
-            )
+            self._set_photo(self.ph_lbl, f, 150, 150)
 
     def take_photo(self) -> None:
-        dlg = CameraDialog(self)
-        if dlg.exec() == QtWidgets.QDialog.Accepted:
-            self.current_photo_path = dlg.captured_path
-            self.ph_lbl.setPixmap(
-                QtGui.QPixmap(self.current_photo_path).scaled(150, 150, QtCore.Qt.KeepAspectRatio)
-            )
+        if self._cam_dlg is None:
+            self._cam_dlg = CameraDialog(self)
+        else:
+            self._cam_dlg.captured_path = None
+            self._cam_dlg.start_camera()
+
+        accepted = self._cam_dlg.exec() == QtWidgets.QDialog.Accepted
+        self._cam_dlg.stop_camera()
+        if accepted and self._cam_dlg.captured_path:
+            self.current_photo_path = self._cam_dlg.captured_path
+            self._set_photo(self.ph_lbl, self.current_photo_path, 150, 150)
 
     def clr_ph(self) -> None:
         self.current_photo_path = None
         self.ph_lbl.setText("No Photo")
+        self._photo_current.pop(self.ph_lbl, None)
 
     def clr_frm(self) -> None:
         self.id.clear()
@@ -763,7 +962,6 @@ class AdminDashboard(QtWidgets.QMainWindow):
         self.clr_ph()
         self.res.clear()
         self.res_badge.setText("STATUS")
-        self.res_badge.setStyleSheet("background:#333")
 
     def init_status_page(self, p: QtWidgets.QWidget, s: str) -> None:
         l = QtWidgets.QVBoxLayout(p)
@@ -774,17 +972,39 @@ class AdminDashboard(QtWidgets.QMainWindow):
         setattr(self, f"t_{s}", t)
 
     def load_status_page(self, p: QtWidgets.QWidget, s: str) -> None:
+        self._ensure_page(p)
         self.stacked.setCurrentWidget(p)
         t = getattr(self, f"t_{s}")
         t.setPlainText("Loading...")
-        w = StatusListWorker(s)
+        w = CallableWorker(get_members_by_status, s)
         w.signals.finished.connect(lambda txt: t.setPlainText(txt))
-        self.pool.start(w)
+        w.signals.finished.connect(self._prewarm_photos)
+        IO_POOL.start(w)
+
+    def _prewarm_photos(self, txt: str, limit: int = 50) -> None:
+        """
+        Pre-decodes check-in-sized photos for the members just listed,
+        so the next scanner swipe hits the pixmap cache instead of
+        paying a JPEG decode. Lines look like "ID — Name — Status: ...".
+        """
+        for line in txt.splitlines()[:limit]:
+            mid = line.split(" — ", 1)[0].strip()
+            if not mid:
+                continue
+            path = find_photo(mid)
+            if not path:
+                continue
+            key = self._photo_key(path, 200, 200)
+            if key in self._pix_cache:
+                continue
+            w = PhotoLoadWorker(path, 200, 200)
+            w.signals.finished.connect(lambda img, k=key: self._cache_pixmap(k, img))
+            SEARCH_POOL.start(w)
 
     def monthly(self) -> None:
-        w = MonthlyListWorker(int(self.yy.currentText()), int(self.mm.currentText()))
+        w = CallableWorker(get_monthly_list, int(self.yy.currentText()), int(self.mm.currentText()))
         w.signals.finished.connect(lambda t: QtWidgets.QMessageBox.information(self, "List", t))
-        self.pool.start(w)
+        IO_POOL.start(w)
 
     def export_pdf(self) -> None:
         y = int(self.yy.currentText())
@@ -796,20 +1016,14 @@ class AdminDashboard(QtWidgets.QMainWindow):
             
         s, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Export", f"R_{m}_{y}.pdf", "PDF (*.pdf)")
         if s:
-            c = canvas.Canvas(s, pagesize=A4)
-            yy = 800
-            c.drawString(50, yy, f"Report {m}/{y}")
-            yy -= 30
-            
-            for l in f.read_text(encoding='utf-8').splitlines():
-                c.drawString(50, yy, l)
-                yy -= 15
-                if yy < 50: 
-                    c.showPage()
-                    yy = 800
-            
-            c.save()
-            QtWidgets.QMessageBox.information(self, "Done", "Exported")
+            w = ExportWorker(f, s, f"Report {m}/{y}")
+            w.signals.finished.connect(
+                lambda path: QtWidgets.QMessageBox.information(self, "Done", f"Exported: {path}")
+            )
+            w.signals.error.connect(
+                lambda msg: QtWidgets.QMessageBox.critical(self, "Error", msg)
+            )
+            IO_POOL.start(w)
 
     def show_brief(self) -> None:
         txt = generate_daily_brief(datetime.date.today() - datetime.timedelta(days=1))
@@ -830,9 +1044,4 @@ class AdminDashboard(QtWidgets.QMainWindow):
         self.close()
 
     def apply_style(self) -> None:
-        self.setStyleSheet("""
-            QMainWindow{background:#0c0c0c;color:white}
-            QLineEdit,QComboBox,QSpinBox,QTextEdit{padding:8px;background:#222;color:white;border:1px solid #444}
-            QPushButton{background:#333;color:white;padding:8px}
-            QPushButton:hover{background:#fc0;color:black}
-        """)
\ No newline at end of file
+        self.setStyleSheet(ADMIN_QSS)
\ No newline at end of file
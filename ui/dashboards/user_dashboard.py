@@ -1,6 +1,7 @@
-import shutil
 import datetime
+import functools
 import os
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -11,18 +12,47 @@ from models.member import Member
 
 # Workers
 from workers.search_worker import SearchWorker
-from workers.save_worker import SaveWorker
+from workers.report_worker import CallableWorker
+from workers.checkin_worker import CheckInWorker
+from workers.renew_worker import RenewWorker
+from workers.pools import SEARCH_POOL, IO_POOL
 
 # Services
-from services.attendance_service import mark_attendance
-from services.member_service import get_member_by_id, renew_membership
-from services.finance_service import log_fee_update
+from services.attendance_service import flush_pending
+from services.file_manager import ingest_photo
+from services.member_service import get_member_by_id, invalidate_photo_cache, save_new_member
 from ai_module.analytics import GymAI
 
 # Dialogs
 from ui.dialogs.renew_dialog import RenewDialog
 from ui.dialogs.camera_dialog import CameraDialog
 
+from ui.utils.pixmaps import load_thumb
+
+# Status badge colors and the stylesheet they feed. Built once at import
+# so the search hot path does a dict lookup plus one % format instead of
+# rebuilding the whole f-string (and its branches) per result.
+BADGE = {"active": "#006600", "pending": "orange"}
+_BADGE_TPL = "background:%s;color:white;font-weight:bold;border-radius:4px;font-size:14px;"
+
+@functools.lru_cache(maxsize=4096)
+def _exists(p: str) -> bool:
+    """
+    Memoized os.path.exists for the photo hot paths: re-searching the
+    same member should not re-stat the same file. Cleared whenever a
+    photo is written (see do_save).
+    """
+    return os.path.exists(p)
+
+
+# Window-wide sheet, built once at import rather than per instantiation
+USER_QSS = """
+    QMainWindow{background:#0c0c0c;color:white}
+    QLineEdit,QComboBox,QSpinBox,QTextEdit{padding:8px;background:#222;color:white;border:1px solid #444}
+    QPushButton{padding:8px;background:#333;color:white;border:1px solid #555}
+    QPushButton:hover{background:#ffcc00;color:black}
+"""
+
 
 class UserDashboard(QtWidgets.QMainWindow):
     """
@@ -45,8 +75,17 @@ class UserDashboard(QtWidgets.QMainWindow):
         self.setWindowTitle(f"Solid Gym - Staff Portal ({username})")
         self.resize(1100, 750)
         
-        self.pool = QtCore.QThreadPool()
         self.current_photo_path: Optional[str] = None
+
+        # GymAI is created once and its peak-hour line cached for a
+        # minute so check-in scans don't pay analytics per swipe
+        self._ai: Optional[GymAI] = None
+        self._ai_ts = 0.0
+        self._ai_cached_text = ""
+
+        # Monotonic search counter; only the newest worker's result may
+        # touch the info panel (see on_search)
+        self._search_seq = 0
         
         self.init_ui()
         self.apply_style()
@@ -91,18 +130,21 @@ class UserDashboard(QtWidgets.QMainWindow):
         self.stacked = QtWidgets.QStackedWidget()
         layout.addWidget(self.stacked)
 
+        # Only the landing page is built up front; the others stay empty
+        # placeholders until first visited (see switch_page), so cold
+        # start pays for one page of widgets instead of three.
         self.page_search = QtWidgets.QWidget()
         self.init_search_page()
         self.stacked.addWidget(self.page_search)
-        
+
         self.page_add = QtWidgets.QWidget()
-        self.init_add_page()
         self.stacked.addWidget(self.page_add)
-        
+
         self.page_att = QtWidgets.QWidget()
-        self.init_attendance_page()
         self.stacked.addWidget(self.page_att)
 
+        self._builders = {1: self.init_add_page, 2: self.init_attendance_page}
+
         # Navigation Logic
         self.btn_search.clicked.connect(lambda: self.switch_page(0))
         self.btn_add.clicked.connect(lambda: self.switch_page(1))
@@ -112,6 +154,9 @@ class UserDashboard(QtWidgets.QMainWindow):
         self.switch_page(0)
 
     def switch_page(self, index: int) -> None:
+        builder = self._builders.pop(index, None)
+        if builder:
+            builder()
         self.stacked.setCurrentIndex(index)
         self.btn_search.setChecked(index == 0)
         self.btn_add.setChecked(index == 1)
@@ -145,7 +190,13 @@ class UserDashboard(QtWidgets.QMainWindow):
         
         self.v_ph = QtWidgets.QLabel()
         self.v_ph.setFixedSize(120, 120)
+        self.v_ph.setAlignment(QtCore.Qt.AlignCenter)
         self.v_ph.setStyleSheet("border:2px solid #555")
+
+        # Filled once; repeated misses just swap in the same pixmap
+        # instead of toggling the label between text and pixmap modes
+        self._empty_thumb = QtGui.QPixmap(120, 120)
+        self._empty_thumb.fill(QtGui.QColor("#222"))
         
         self.v_badge = QtWidgets.QLabel("ACTIVE")
         self.v_badge.setFixedSize(120, 40)
@@ -177,10 +228,21 @@ class UserDashboard(QtWidgets.QMainWindow):
         if not q: 
             return
         
-        # Search constrained by User's gender
-        w = SearchWorker(q, is_admin=False, user_gender=self.user_gender)
-        w.signals.finished.connect(self._found)
-        self.pool.start(w)
+        # Each dispatch bumps the sequence number; results from older
+        # workers compare stale and are dropped, so hammering Enter
+        # never re-lays-out the info panel once per queued search
+        self._search_seq += 1
+        seq = self._search_seq
+
+        # Search constrained by User's gender. The worker also checks
+        # the token itself, so a superseded search bails out before the
+        # database read rather than only at delivery.
+        w = SearchWorker(q, is_admin=False, user_gender=self.user_gender,
+                         generation=seq, token_ref=lambda: self._search_seq)
+        w.signals.finished.connect(
+            lambda d, s=seq: s == self._search_seq and self._found(d)
+        )
+        SEARCH_POOL.start(w)
 
     def _found(self, d: Dict[str, Any]) -> None:
         if d.get("access_denied"): 
@@ -197,16 +259,9 @@ class UserDashboard(QtWidgets.QMainWindow):
         st = p.get('status', 'Expired')
 
         # Badge Style
-        c = "#b00"
-        if st.lower() == "active":
-            c = "#006600"
-        elif st.lower() == "pending":
-            c = "orange"
-
+        c = BADGE.get(st.lower(), "#b00")
         self.v_badge.setText(st.upper())
-        self.v_badge.setStyleSheet(
-            f"background: {c}; color: white; font-weight: bold; border-radius: 4px; font-size: 14px;"
-        )
+        self.v_badge.setStyleSheet(_BADGE_TPL % c)
 
         pkg = p.get('package', 'Bronze')
         join_date = f"{p.get('day', 0):02d}/{p.get('month', 0):02d}/{p.get('year', 0)}"
@@ -220,30 +275,38 @@ class UserDashboard(QtWidgets.QMainWindow):
                
         self.v_det.setPlainText(txt)
         
-        if p.get('photo_path') and os.path.exists(p['photo_path']):
-            self.v_ph.setPixmap(QtGui.QPixmap(p['photo_path']).scaled(120, 120, QtCore.Qt.KeepAspectRatio))
+        if p.get('photo_path') and _exists(p['photo_path']):
+            self.v_ph.setPixmap(load_thumb(p['photo_path'], 120, 120))
         else:
-            self.v_ph.clear()
-            self.v_ph.setText("No Photo")
+            self.v_ph.setPixmap(self._empty_thumb)
 
     def open_renew_dialog(self) -> None:
         if not hasattr(self, 'current_view_id') or not self.current_view_id: 
             return
             
         current_data = get_member_by_id(self.current_view_id)
-        current_expiry = current_data.get('end_date', '') if current_data else None
-        
+        exp_str = current_data.get('end_date') if current_data else None
+        try:
+            current_expiry = datetime.date.fromisoformat(exp_str) if exp_str else None
+        except ValueError:
+            current_expiry = None
+
         dlg = RenewDialog(self, current_expiry)
         if dlg.exec() == QtWidgets.QDialog.Accepted:
             data = dlg.result_data
-            try:
-                renew_membership(self.current_view_id, data['start_date'], data['end_date'], data['months'])
-                log_fee_update(self.current_username, self.current_view_id, data['months'])
-                
-                QtWidgets.QMessageBox.information(self, "Success", "Fee Updated & Logged!")
-                self.on_search()
-            except Exception as e:
-                QtWidgets.QMessageBox.critical(self, "Error", str(e))
+            w = RenewWorker(
+                self.current_view_id, self.current_username,
+                data['start_date'], data['end_date'], data['months']
+            )
+            w.signals.finished.connect(self._renewed)
+            w.signals.error.connect(
+                lambda msg: QtWidgets.QMessageBox.critical(self, "Error", msg)
+            )
+            IO_POOL.start(w)
+
+    def _renewed(self) -> None:
+        QtWidgets.QMessageBox.information(self, "Success", "Fee Updated & Logged!")
+        self.on_search()
 
     # --- 2. ADD PAGE ---
     def init_add_page(self) -> None:
@@ -334,15 +397,13 @@ class UserDashboard(QtWidgets.QMainWindow):
         f, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Select Photo", "", "Images (*.png *.jpg *.jpeg)")
         if f:
             self.current_photo_path = f
-            self.add_ph_lbl.setPixmap(QtGui.QPixmap(f).scaled(120, 120, QtCore.Qt.KeepAspectRatio))
+            self.add_ph_lbl.setPixmap(load_thumb(f, 120, 120))
 
     def take_photo(self) -> None:
         dlg = CameraDialog(self)
         if dlg.exec() == QtWidgets.QDialog.Accepted:
             self.current_photo_path = dlg.captured_path
-            self.add_ph_lbl.setPixmap(
-                QtGui.QPixmap(self.current_photo_path).scaled(120, 120, QtCore.Qt.KeepAspectRatio)
-            )
+            self.add_ph_lbl.setPixmap(load_thumb(self.current_photo_path, 120, 120))
 
     def do_save(self) -> None:
         if not self.aid.text() or not self.aname.text():
@@ -354,13 +415,18 @@ class UserDashboard(QtWidgets.QMainWindow):
             clean_id = self.aid.text().strip().upper()
 
             # Handle Photo
-            if self.current_photo_path and os.path.exists(self.current_photo_path):
-                if not config.PHOTOS_FOLDER.exists(): 
+            if self.current_photo_path and _exists(self.current_photo_path):
+                if not _exists(str(config.PHOTOS_FOLDER)):
                     config.PHOTOS_FOLDER.mkdir(parents=True, exist_ok=True)
-                    
+                    _exists.cache_clear()
+
                 dest = config.PHOTOS_FOLDER / f"{clean_id}{Path(self.current_photo_path).suffix}"
                 if Path(self.current_photo_path).resolve() != dest.resolve():
-                    shutil.copy2(self.current_photo_path, dest)
+                    ingest_photo(self.current_photo_path, dest)
+                    invalidate_photo_cache()
+                    # The stat cache may hold a stale 'missing' answer
+                    # for the file that was just written
+                    _exists.cache_clear()
                 pp = str(dest)
 
             jd = datetime.date(int(self.ayear.currentText()), int(self.amonth.currentText()), self.aday.value())
@@ -385,12 +451,12 @@ class UserDashboard(QtWidgets.QMainWindow):
                 photo_path=pp
             )
 
-            w = SaveWorker(m)
+            w = CallableWorker(save_new_member, m)
             w.signals.finished.connect(lambda: [
                 self.clear_add(), 
                 QtWidgets.QMessageBox.information(self, "Success", "Member sent for Approval!")
             ])
-            self.pool.start(w)
+            IO_POOL.start(w)
             
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Error", str(e))
@@ -435,7 +501,17 @@ class UserDashboard(QtWidgets.QMainWindow):
         
         self.chk_ph = QtWidgets.QLabel("Waiting...")
         self.chk_ph.setFixedSize(200, 200)
+        self.chk_ph.setAlignment(QtCore.Qt.AlignCenter)
         self.chk_ph.setStyleSheet("border:3px solid #333;background:#000")
+
+        # Rendered once; reused for every photo-less scan so misses
+        # don't pay text layout per swipe
+        self._no_photo_pm = QtGui.QPixmap(200, 200)
+        self._no_photo_pm.fill(QtCore.Qt.black)
+        p = QtGui.QPainter(self._no_photo_pm)
+        p.setPen(QtCore.Qt.white)
+        p.drawText(self._no_photo_pm.rect(), QtCore.Qt.AlignCenter, "No Photo")
+        p.end()
         
         self.chk_nm = QtWidgets.QLabel("Name: -")
         self.chk_nm.setStyleSheet("font-size:20px;font-weight:bold;color:#fc0")
@@ -465,13 +541,20 @@ class UserDashboard(QtWidgets.QMainWindow):
 
     def do_checkin(self) -> None:
         mid = self.att_id.text().strip()
-        if not mid: 
+        if not mid:
             return
-            
-        d = get_member_by_id(mid)
+
+        # Clear right away so the next scan can start while this one
+        # resolves on the thread pool
+        self.att_id.clear()
+
+        w = CheckInWorker(mid)
+        w.signals.finished.connect(self._on_checkin)
+        IO_POOL.start(w)
+
+    def _on_checkin(self, d: dict) -> None:
         if not d:
             QtWidgets.QMessageBox.warning(self, "Unknown", "ID not found")
-            self.att_id.clear()
             self.chk_nm.setText("-")
             self.chk_st.setText("NOT FOUND")
             return
@@ -487,27 +570,34 @@ class UserDashboard(QtWidgets.QMainWindow):
         )
 
         if d.get('photo_path'):
-            self.chk_ph.setPixmap(
-                QtGui.QPixmap(d['photo_path']).scaled(200, 200, QtCore.Qt.KeepAspectRatio)
-            )
+            self.chk_ph.setPixmap(load_thumb(d['photo_path'], 200, 200))
         else:
-            self.chk_ph.clear()
-            self.chk_ph.setText("No Photo")
+            self.chk_ph.setPixmap(self._no_photo_pm)
 
-        mark_attendance(mid)
-        self.att_id.clear()
-        
-        ai = GymAI()
-        self.lbl_ai.setText(f"AI: {ai.predict_peak_hours()}")
+        # Attendance was already recorded by the worker
+        self.lbl_ai.setText(f"AI: {self._peak_hours_text()}")
+
+    def _peak_hours_text(self) -> str:
+        """Peak-hour line from a cached GymAI, refreshed at most per minute."""
+        if self._ai is None:
+            self._ai = GymAI()
+
+        now = time.monotonic()
+        if not self._ai_cached_text or now - self._ai_ts > 60:
+            self._ai_cached_text = self._ai.predict_peak_hours()
+            self._ai_ts = now
+
+        return self._ai_cached_text
 
     def logout(self) -> None:
         self.logout_signal.emit()
         self.close()
 
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        # Don't leave buffered check-ins sitting in memory when the
+        # staff window goes away
+        flush_pending()
+        super().closeEvent(event)
+
     def apply_style(self) -> None:
-        self.setStyleSheet("""
-            QMainWindow{background:#0c0c0c;color:white}
-            QLineEdit,QComboBox,QSpinBox,QTextEdit{padding:8px;background:#222;color:white;border:1px solid #444}
-            QPushButton{padding:8px;background:#333;color:white;border:1px solid #555}
-            QPushButton:hover{background:#ffcc00;color:black}
-        """)
\ No newline at end of file
+        self.setStyleSheet(USER_QSS)
\ No newline at end of file
@@ -0,0 +1,15 @@
+from PySide6 import QtWidgets
+
+
+def make_line_edit(placeholder: str, *, password: bool = False, min_h: int = 40) -> QtWidgets.QLineEdit:
+    """
+    Builds a QLineEdit with the setup sequence every dialog repeats:
+    placeholder text, optional password echo mode, and a minimum height.
+    Styling comes from the dialog-level QSS, not per-widget calls.
+    """
+    edit = QtWidgets.QLineEdit()
+    edit.setPlaceholderText(placeholder)
+    if password:
+        edit.setEchoMode(QtWidgets.QLineEdit.Password)
+    edit.setMinimumHeight(min_h)
+    return edit
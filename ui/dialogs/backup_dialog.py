@@ -1,6 +1,15 @@
 from typing import Optional
 from PySide6 import QtWidgets, QtCore, QtGui
-from services.cloud_service import create_local_backup, upload_to_drive
+from workers.backup_worker import BackupWorker
+
+# Dialog-wide sheet, built once at import rather than per instantiation
+_QSS = """
+    QDialog { background: #1a1a1a; border: 2px solid #ffcc00; border-radius: 10px; }
+    QLabel { color: white; font-family: 'Segoe UI'; }
+    QLineEdit { padding: 8px; border: 1px solid #444; background: #111; color: white; border-radius: 4px; }
+    QPushButton { color: white; font-weight: bold; border-radius: 5px; }
+    QPushButton:hover { background: #ffcc00; color: black; }
+"""
 
 
 class BackupDialog(QtWidgets.QDialog):
@@ -44,12 +53,27 @@ class BackupDialog(QtWidgets.QDialog):
         self.email_inp.setPlaceholderText("Enter Admin Email (Optional)")
         layout.addWidget(self.email_inp)
 
+        # --- Progress ---
+        # Indeterminate bar + status line driven by the worker's signals;
+        # hidden until a backup actually starts.
+        self.progress = QtWidgets.QProgressBar()
+        self.progress.setRange(0, 0)
+        self.progress.setTextVisible(False)
+        self.progress.hide()
+        layout.addWidget(self.progress)
+
+        self.lbl_status = QtWidgets.QLabel("")
+        self.lbl_status.setWordWrap(True)
+        self.lbl_status.setAlignment(QtCore.Qt.AlignCenter)
+        self.lbl_status.setStyleSheet("color: #aaa; font-size: 12px;")
+        layout.addWidget(self.lbl_status)
+
         # --- Buttons ---
-        btn_backup = QtWidgets.QPushButton("🚀 Start Cloud Backup")
-        btn_backup.setFixedHeight(40)
-        btn_backup.setStyleSheet("background: #006600; font-size: 14px;")
-        btn_backup.clicked.connect(self.start_backup)
-        layout.addWidget(btn_backup)
+        self.btn_backup = QtWidgets.QPushButton("🚀 Start Cloud Backup")
+        self.btn_backup.setFixedHeight(40)
+        self.btn_backup.setStyleSheet("background: #006600; font-size: 14px;")
+        self.btn_backup.clicked.connect(self.start_backup)
+        layout.addWidget(self.btn_backup)
 
         btn_ignore = QtWidgets.QPushButton("Ignore / Skip")
         btn_ignore.setStyleSheet("background: transparent; color: #666; text-decoration: underline;")
@@ -57,26 +81,33 @@ class BackupDialog(QtWidgets.QDialog):
         layout.addWidget(btn_ignore)
 
     def start_backup(self) -> None:
-        # 1. Create Local Zip
-        self.hide()  # Hide popup during process to prevent double clicks
-        
-        # create_local_backup returns (path, error_message)
-        zip_path, err = create_local_backup()
-
+        # Zip + upload both block for seconds, so they run on a worker
+        # thread; the dialog stays up showing progress instead of the
+        # old hide-and-freeze flow.
+        self.btn_backup.setEnabled(False)
+        self.progress.show()
+        self.lbl_status.setText("Zipping gym data...")
+        self._zip_path = ""
+
+        worker = BackupWorker()
+        worker.signals.zip_done.connect(self._on_zip_done)
+        worker.signals.upload_done.connect(self._on_upload_done)
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def _on_zip_done(self, zip_path: str, err: str) -> None:
         if not zip_path:
+            self.progress.hide()
             QtWidgets.QMessageBox.critical(None, "Error", f"Failed to zip data: {err}")
-            self.accept() # Close dialog even on error
+            self.accept()  # Close dialog even on error
             return
 
-        # 2. Upload to Cloud
-        msg = QtWidgets.QMessageBox()
-        msg.setWindowTitle("Uploading...")
-        msg.setText("Connecting to Google Drive...\nPlease check your browser to login if prompted.")
-        msg.show()
+        self._zip_path = zip_path
+        self.lbl_status.setText(
+            "Connecting to Google Drive...\nPlease check your browser to login if prompted."
+        )
 
-        # upload_to_drive returns (success_bool, file_id_or_error)
-        success, result = upload_to_drive(zip_path)
-        msg.close()
+    def _on_upload_done(self, success: bool, result: str) -> None:
+        self.progress.hide()
 
         if success:
             QtWidgets.QMessageBox.information(
@@ -87,16 +118,10 @@ class BackupDialog(QtWidgets.QDialog):
             QtWidgets.QMessageBox.warning(
                 None, "Partial Success",
                 f"Could not connect to Google Drive ({result}).\n\n"
-                f"HOWEVER: A local backup was saved to your Desktop:\n{zip_path}"
+                f"HOWEVER: A local backup was saved to your Desktop:\n{self._zip_path}"
             )
 
         self.accept()
 
     def apply_style(self) -> None:
-        self.setStyleSheet("""
-            QDialog { background: #1a1a1a; border: 2px solid #ffcc00; border-radius: 10px; }
-            QLabel { color: white; font-family: 'Segoe UI'; }
-            QLineEdit { padding: 8px; border: 1px solid #444; background: #111; color: white; border-radius: 4px; }
-            QPushButton { color: white; font-weight: bold; border-radius: 5px; }
-            QPushButton:hover { background: #ffcc00; color: black; }
-        """)
\ No newline at end of file
+        self.setStyleSheet(_QSS)
\ No newline at end of file
@@ -1,9 +1,41 @@
+import sys
+
 import cv2
+import numpy as np
 from PySide6 import QtWidgets, QtCore, QtGui
 from pathlib import Path
 from typing import Optional
 
 
+class CamWorker(QtCore.QThread):
+    """
+    Grabs webcam frames on a background thread and hands each one to
+    the GUI via a signal, so the blocking cap.read() can never stall
+    the event loop the way timer-driven polling on the GUI thread did.
+    """
+    frame_ready = QtCore.Signal(object)  # emits the raw BGR ndarray
+
+    def __init__(self, cap: cv2.VideoCapture, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self.cap = cap
+        self._run = True
+
+    def run(self) -> None:
+        while self._run:
+            ret, frame = self.cap.read()
+            if ret:
+                self.frame_ready.emit(frame)
+            else:
+                # Failed grab (camera unplugged, driver hiccup): back
+                # off instead of spinning a core on instant failures,
+                # and keep retrying in case the device comes back
+                self.msleep(100)
+
+    def stop(self) -> None:
+        self._run = False
+        self.wait()
+
+
 class CameraDialog(QtWidgets.QDialog):
     """
     A dialog that accesses the default webcam to capture a member's photo.
@@ -13,14 +45,19 @@ class CameraDialog(QtWidgets.QDialog):
         super().__init__(parent)
         self.setWindowTitle("📷 Take Photo")
         self.resize(600, 500)
-        
+
         self.captured_path: Optional[str] = None
-        self.timer = QtCore.QTimer()
         self.cap: Optional[cv2.VideoCapture] = None
+        self.worker: Optional[CamWorker] = None
         self.current_frame = None
-        
+        self._rgb = None  # backing buffer for the preview QImage
+
         self.init_ui()
 
+        # Display size is cached and refreshed in resizeEvent, so the
+        # per-frame path never queries the label
+        self._target_sz = self.lbl_feed.size()
+
         # Start camera automatically
         self.start_camera()
 
@@ -47,50 +84,100 @@ class CameraDialog(QtWidgets.QDialog):
         layout.addWidget(btn)
 
     def start_camera(self) -> None:
-        # 0 is usually the default webcam
-        self.cap = cv2.VideoCapture(0)
+        # 0 is usually the default webcam; DirectShow avoids the slow
+        # MSMF negotiation on Windows
+        if sys.platform == "win32":
+            self.cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
+        else:
+            self.cap = cv2.VideoCapture(0)
         if not self.cap.isOpened():
             QtWidgets.QMessageBox.warning(self, "Error", "Could not access webcam.\nPlease check connection.")
             self.reject()
             return
 
-        # Update frame every 30ms (approx 30 FPS)
-        self.timer.timeout.connect(self.update_frame)
-        self.timer.start(30)
+        # Ask the camera itself to compress (MJPG) at a modest preview
+        # resolution, so cap.read() pulls ~40 KB frames over USB instead
+        # of multi-MB uncompressed ones at the driver's default size
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        self.cap.set(cv2.CAP_PROP_FPS, 30)
 
-    def update_frame(self) -> None:
-        if not self.cap:
-            return
-            
-        ret, frame = self.cap.read()
-        if ret:
-            self.current_frame = frame
-            # Convert OpenCV (BGR) to Qt (RGB)
-            rgb_img = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = rgb_img.shape
-            bytes_per_line = ch * w
+        self.worker = CamWorker(self.cap, self)
+        self.worker.frame_ready.connect(self.on_frame)
+        self.worker.start()
+
+    def on_frame(self, frame) -> None:
+        self.current_frame = frame
+
+        # Downscale the raw array to the label size first — resizing a
+        # few hundred thousand pixels with cv2 beats converting and
+        # Qt-scaling a full camera frame every tick
+        fh, fw = frame.shape[:2]
+        scale = min(self._target_sz.width() / fw, self._target_sz.height() / fh)
+        if scale < 1.0:
+            frame = cv2.resize(
+                frame,
+                (max(1, int(fw * scale)), max(1, int(fh * scale))),
+                interpolation=cv2.INTER_AREA,
+            )
 
-            q_img = QtGui.QImage(rgb_img.data, w, h, bytes_per_line, QtGui.QImage.Format_RGB888)
+        # Convert OpenCV (BGR) to Qt (RGB) with a plain channel reversal
+        # — for a 3-channel swap numpy's slice+contiguous-copy does the
+        # same job as cv2.cvtColor without the color-science machinery.
+        # The buffer is kept on self: QImage aliases it rather than
+        # copying, so it must stay alive until the next frame replaces it.
+        self._rgb = np.ascontiguousarray(frame[:, :, ::-1])
+        h, w, ch = self._rgb.shape
+        bytes_per_line = ch * w
 
-            # Scale to fit label while keeping aspect ratio
-            pixmap = QtGui.QPixmap.fromImage(q_img)
-            self.lbl_feed.setPixmap(pixmap.scaled(self.lbl_feed.size(), QtCore.Qt.KeepAspectRatio))
+        q_img = QtGui.QImage(self._rgb.data, w, h, bytes_per_line, QtGui.QImage.Format_RGB888)
+
+        # Already display-sized: no .scaled() pass needed
+        self.lbl_feed.setPixmap(QtGui.QPixmap.fromImage(q_img))
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        self._target_sz = self.lbl_feed.size()
+        super().resizeEvent(event)
 
     def capture_image(self) -> None:
         if hasattr(self, 'current_frame') and self.current_frame is not None:
             # Save to a temporary file in user's home directory
             # Using Path.home() ensures no personal path is hardcoded in the repo
             temp_path = Path.home() / "solidgym_temp_capture.jpg"
-            cv2.imwrite(str(temp_path), self.current_frame)
+
+            # Member photos are shown as small thumbnails, so store a
+            # ~480px optimized JPEG instead of the raw frame at default
+            # quality — smaller file, faster decode on every display
+            frame = self.current_frame
+            h, w = frame.shape[:2]
+            if w > 480:
+                frame = cv2.resize(frame, (480, 480 * h // w), interpolation=cv2.INTER_AREA)
+            cv2.imwrite(
+                str(temp_path), frame,
+                [cv2.IMWRITE_JPEG_QUALITY, 85, cv2.IMWRITE_JPEG_OPTIMIZE, 1],
+            )
 
             self.captured_path = str(temp_path)
+            # Release the webcam before accept() returns control to the
+            # caller, so a follow-up dialog can open it right away
+            self.stop_camera()
             self.accept()  # Close dialog with "Success" result
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         self.stop_camera()
         event.accept()
 
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:
+        # Covers accept()/reject() paths, which hide the dialog without
+        # a close event; stop_camera is idempotent so overlap is fine
+        self.stop_camera()
+        super().hideEvent(event)
+
     def stop_camera(self) -> None:
-        self.timer.stop()
+        if self.worker:
+            self.worker.stop()
+            self.worker = None
         if self.cap:
-            self.cap.release()
\ No newline at end of file
+            self.cap.release()
+            self.cap = None
\ No newline at end of file
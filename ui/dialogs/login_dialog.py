@@ -1,14 +1,93 @@
 import sys
-import os
-import subprocess
+from collections import namedtuple
 from pathlib import Path
 from typing import Optional, Tuple
 
 from PySide6 import QtWidgets, QtCore, QtGui
 
 from services.auth_service import verify_user
-from ui.dialogs.register_dialog import RegisterDialog
-import config
+from ui.dialogs._widgets import make_line_edit
+from ui.utils.pixmaps import load_thumb
+
+# Dialog-wide sheet, built once at import: the login dialog is rebuilt
+# after every logout and should not re-parse the QSS each time
+_LOGIN_QSS = """
+    QDialog { background: #0c0c0c; color: #ffffff; font-family: 'Segoe UI'; }
+    QLabel { color: #ffffff; font-size: 14px; }
+    QLineEdit {
+        background: #1b1b1b; color: #ffffff; border: 1px solid #333;
+        border-radius: 6px; padding: 10px; font-size: 14px;
+    }
+    QLineEdit:focus { border: 1px solid #ffcc00; }
+    QPushButton {
+        background: #b71c1c; color: #ffffff; border-radius: 8px;
+        font-weight: bold; font-size: 15px; border: none;
+    }
+    QPushButton:hover { background: #d32f2f; }
+    QGroupBox { border: 1px solid #333; border-radius: 8px; margin-top: 10px; font-weight: bold; color: #aaa; }
+    QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }
+"""
+
+# Per-developer circular button style; only the accent color varies
+_DEV_BTN_QSS_TMPL = """
+    QPushButton {{
+        background-color: transparent;
+        border: 2px solid {c};
+        border-radius: 32px;
+        padding: 12px;
+    }}
+    QPushButton:hover {{
+        background-color: {c};
+    }}
+"""
+
+
+def _resolve_icon(name: str) -> Optional[Path]:
+    """
+    Stats the icon file once at import; reopening the dialog after every
+    logout then touches the filesystem zero times for the credits row.
+    """
+    p = Path(f"assets/images/{name}")
+    return p if p.exists() else None
+
+
+# The developer credits never change at runtime, so the dict lookups,
+# defaults and icon existence checks are resolved once at import into
+# plain attribute access
+Dev = namedtuple('Dev', 'icon_path link color name')
+
+
+def _load_devs() -> tuple:
+    """
+    Reads config.DEVELOPERS exactly once, at module load. config is
+    only needed for this snapshot, so it stays out of the module
+    namespace instead of being kept alive by a top-level import.
+    """
+    import config
+    return tuple(
+        Dev(
+            _resolve_icon(d.get('icon', 'default.png')),
+            d.get('link', '#'),
+            d.get('color', '#ffffff'),
+            d.get('name', 'Developer'),
+        )
+        for d in getattr(config, 'DEVELOPERS', [])
+    )
+
+
+_DEVS = _load_devs()
+
+
+def _get_dev_icon(path: Optional[Path]) -> Optional[QtGui.QIcon]:
+    """
+    Returns a QIcon for the path, or None if the file was missing at
+    import. The canonical cached object is the 32x32 pixmap in
+    QPixmapCache (via load_thumb), so QIcon never re-decodes the PNG
+    for other sizes; wrapping the cached pixmap is a shallow copy.
+    """
+    if path is None:
+        return None
+    return QtGui.QIcon(load_thumb(str(path), 32, 32))
 
 
 class LoginDialog(QtWidgets.QDialog):
@@ -53,14 +132,8 @@ class LoginDialog(QtWidgets.QDialog):
         form_layout = QtWidgets.QFormLayout()
         form_layout.setVerticalSpacing(15)
 
-        self.uname = QtWidgets.QLineEdit()
-        self.uname.setPlaceholderText("Enter username")
-        self.uname.setMinimumHeight(45)
-
-        self.passwd = QtWidgets.QLineEdit()
-        self.passwd.setPlaceholderText("Enter password")
-        self.passwd.setEchoMode(QtWidgets.QLineEdit.Password)
-        self.passwd.setMinimumHeight(45)
+        self.uname = make_line_edit("Enter username", min_h=45)
+        self.passwd = make_line_edit("Enter password", password=True, min_h=45)
 
         form_layout.addRow(QtWidgets.QLabel("Username:"), self.uname)
         form_layout.addRow(QtWidgets.QLabel("Password:"), self.passwd)
@@ -85,10 +158,7 @@ class LoginDialog(QtWidgets.QDialog):
         layout.addSpacing(10)
 
         # --- DEVELOPER CONTACT SECTION ---
-        # We check if 'DEVELOPERS' exists in config to avoid crashes
-        developers = getattr(config, 'DEVELOPERS', [])
-        
-        if developers:
+        if _DEVS:
             contact_group = QtWidgets.QGroupBox("👤 Developer Team")
             contact_layout = QtWidgets.QVBoxLayout(contact_group)
             contact_layout.setContentsMargins(10, 20, 10, 15)
@@ -97,7 +167,7 @@ class LoginDialog(QtWidgets.QDialog):
             devs_row.setSpacing(50)  # Space between developer columns
             devs_row.addStretch()
 
-            for dev in developers:
+            for dev in _DEVS:
                 # Vertical layout for each person
                 person_layout = QtWidgets.QVBoxLayout()
                 person_layout.setSpacing(8)
@@ -107,33 +177,21 @@ class LoginDialog(QtWidgets.QDialog):
                 btn.setFixedSize(64, 64)
                 btn.setCursor(QtCore.Qt.PointingHandCursor)
 
-                # Load Icon
-                img_path = Path(f"assets/images/{dev.get('icon', 'default.png')}")
-                if img_path.exists():
-                    btn.setIcon(QtGui.QIcon(str(img_path)))
+                # Load Icon (cached across login cycles)
+                icon = _get_dev_icon(dev.icon_path)
+                if icon:
+                    btn.setIcon(icon)
                     btn.setIconSize(QtCore.QSize(32, 32))
                 else:
                     btn.setText("LINK")
 
-                link = dev.get('link', '#')
-                btn.clicked.connect(lambda checked=False, u=link: self.open_url(u))
+                btn.clicked.connect(lambda checked=False, u=dev.link: self.open_url(u))
 
                 # Circular Style
-                color = dev.get('color', '#ffffff')
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: transparent;
-                        border: 2px solid {color};
-                        border-radius: 32px;
-                        padding: 12px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: {color};
-                    }}
-                """)
+                btn.setStyleSheet(_DEV_BTN_QSS_TMPL.format(c=dev.color))
 
                 # 2. Name Label
-                lbl_name = QtWidgets.QLabel(dev.get('name', 'Developer'))
+                lbl_name = QtWidgets.QLabel(dev.name)
                 lbl_name.setAlignment(QtCore.Qt.AlignCenter)
                 lbl_name.setStyleSheet("color: white; font-weight: bold; font-size: 13px;")
 
@@ -159,22 +217,7 @@ class LoginDialog(QtWidgets.QDialog):
         layout.addLayout(exit_layout)
 
     def apply_style(self) -> None:
-        self.setStyleSheet("""
-            QDialog { background: #0c0c0c; color: #ffffff; font-family: 'Segoe UI'; }
-            QLabel { color: #ffffff; font-size: 14px; }
-            QLineEdit { 
-                background: #1b1b1b; color: #ffffff; border: 1px solid #333; 
-                border-radius: 6px; padding: 10px; font-size: 14px;
-            }
-            QLineEdit:focus { border: 1px solid #ffcc00; }
-            QPushButton { 
-                background: #b71c1c; color: #ffffff; border-radius: 8px; 
-                font-weight: bold; font-size: 15px; border: none;
-            }
-            QPushButton:hover { background: #d32f2f; }
-            QGroupBox { border: 1px solid #333; border-radius: 8px; margin-top: 10px; font-weight: bold; color: #aaa; }
-            QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }
-        """)
+        self.setStyleSheet(_LOGIN_QSS)
 
     def do_login(self) -> None:
         uname = self.uname.text().strip()
@@ -190,6 +233,9 @@ class LoginDialog(QtWidgets.QDialog):
             QtWidgets.QMessageBox.critical(self, "Login Failed", "Invalid username or password.")
 
     def open_register(self) -> None:
+        # Most logins never register anyone; import the dialog only when
+        # the link is actually clicked
+        from ui.dialogs.register_dialog import RegisterDialog
         dlg = RegisterDialog(self)
         dlg.exec()
 
@@ -197,12 +243,7 @@ class LoginDialog(QtWidgets.QDialog):
         sys.exit(0)
 
     def open_url(self, url: str) -> None:
-        try:
-            if sys.platform == 'win32':
-                os.startfile(url)
-            elif sys.platform == 'darwin':
-                subprocess.Popen(['open', url])
-            else:
-                subprocess.Popen(['xdg-open', url])
-        except Exception as e:
-            QtWidgets.QMessageBox.warning(self, "Error", f"Could not open link: {e}")
\ No newline at end of file
+        # Qt's own launcher: no helper-process fork and no per-platform
+        # branching needed
+        if not QtGui.QDesktopServices.openUrl(QtCore.QUrl(url)):
+            QtWidgets.QMessageBox.warning(self, "Error", f"Could not open link: {url}")
\ No newline at end of file
@@ -1,7 +1,26 @@
 from PySide6 import QtWidgets, QtCore
 from services.auth_service import create_user
+from ui.dialogs._widgets import make_line_edit
 from typing import Optional
 
+# Dialog-wide sheet, built once at import rather than per instantiation
+_REGISTER_QSS = """
+    QDialog { background: #0c0c0c; color: white; font-family: 'Segoe UI'; }
+    QLabel { color: white; font-size: 14px; }
+    QLineEdit, QComboBox {
+        background: #1b1b1b; color: white; border: 1px solid #333;
+        border-radius: 6px; padding: 5px; font-size: 13px;
+    }
+    QLineEdit:focus, QComboBox:focus { border: 1px solid #ffcc00; }
+    QLineEdit#masterPass { border: 1px solid #ffcc00; }
+    QPushButton {
+        background: #b71c1c; color: white; border-radius: 8px;
+        font-weight: bold; font-size: 14px;
+    }
+    QPushButton:hover { background: #d32f2f; }
+    QComboBox::drop-down { border: none; }
+"""
+
 
 class RegisterDialog(QtWidgets.QDialog):
     """
@@ -30,14 +49,8 @@ class RegisterDialog(QtWidgets.QDialog):
         layout.addWidget(title)
 
         # Form Inputs
-        self.uname = QtWidgets.QLineEdit()
-        self.uname.setPlaceholderText("Choose a Username")
-        self.uname.setMinimumHeight(40)
-
-        self.passwd = QtWidgets.QLineEdit()
-        self.passwd.setPlaceholderText("Choose a Password")
-        self.passwd.setEchoMode(QtWidgets.QLineEdit.Password)
-        self.passwd.setMinimumHeight(40)
+        self.uname = make_line_edit("Choose a Username")
+        self.passwd = make_line_edit("Choose a Password", password=True)
 
         self.gender = QtWidgets.QComboBox()
         self.gender.addItems(["Select Gender", "Male", "Female"])
@@ -49,27 +62,23 @@ class RegisterDialog(QtWidgets.QDialog):
         self.role_select.setMinimumHeight(40)
         self.role_select.currentTextChanged.connect(self.toggle_admin_input)
 
-        # Master Password (Hidden by default)
-        self.master_pass = QtWidgets.QLineEdit()
-        self.master_pass.setPlaceholderText("Enter Master Key (Required for Admin)")
-        self.master_pass.setEchoMode(QtWidgets.QLineEdit.Password)
-        self.master_pass.setMinimumHeight(40)
+        # Master Password (Hidden by default; gold border via #masterPass
+        # selector in the dialog QSS)
+        self.master_pass = make_line_edit("Enter Master Key (Required for Admin)", password=True)
+        self.master_pass.setObjectName("masterPass")
         self.master_pass.setVisible(False)
-        self.master_pass.setStyleSheet("border: 1px solid #ffcc00;")
 
-        # Layout Assembly
-        layout.addWidget(QtWidgets.QLabel("Username:"))
-        layout.addWidget(self.uname)
-        
-        layout.addWidget(QtWidgets.QLabel("Password:"))
-        layout.addWidget(self.passwd)
-        
-        layout.addWidget(QtWidgets.QLabel("Gender:"))
-        layout.addWidget(self.gender)
-        
-        layout.addWidget(QtWidgets.QLabel("Account Role:"))
-        layout.addWidget(self.role_select)
-        
+        # Layout Assembly — QFormLayout creates the field labels itself,
+        # so there are no standalone QLabel objects to allocate and the
+        # rows settle in a single layout pass
+        form = QtWidgets.QFormLayout()
+        form.setVerticalSpacing(15)
+        form.addRow("Username:", self.uname)
+        form.addRow("Password:", self.passwd)
+        form.addRow("Gender:", self.gender)
+        form.addRow("Account Role:", self.role_select)
+        layout.addLayout(form)
+
         # Only visible if Admin is selected
         layout.addWidget(self.master_pass)
 
@@ -124,18 +133,4 @@ class RegisterDialog(QtWidgets.QDialog):
             QtWidgets.QMessageBox.critical(self, "Error", str(e))
 
     def apply_style(self) -> None:
-        self.setStyleSheet("""
-            QDialog { background: #0c0c0c; color: white; font-family: 'Segoe UI'; }
-            QLabel { color: white; font-size: 14px; }
-            QLineEdit, QComboBox { 
-                background: #1b1b1b; color: white; border: 1px solid #333; 
-                border-radius: 6px; padding: 5px; font-size: 13px;
-            }
-            QLineEdit:focus, QComboBox:focus { border: 1px solid #ffcc00; }
-            QPushButton { 
-                background: #b71c1c; color: white; border-radius: 8px; 
-                font-weight: bold; font-size: 14px;
-            }
-            QPushButton:hover { background: #d32f2f; }
-            QComboBox::drop-down { border: none; }
-        """)
\ No newline at end of file
+        self.setStyleSheet(_REGISTER_QSS)
\ No newline at end of file
@@ -3,27 +3,42 @@ from typing import Optional, Dict, Any
 from PySide6 import QtWidgets, QtCore
 from core.utils import add_months
 
+# Dialog-wide sheet, built once at import rather than per instantiation
+_RENEW_QSS = """
+    QDialog { background: #1a1a1a; color: white; font-family: 'Segoe UI'; }
+    QGroupBox { border: 1px solid #444; margin-top: 10px; padding-top: 15px; font-weight: bold; }
+    QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }
+    QLabel { color: white; }
+    QDateEdit, QSpinBox { background: #222; color: white; border: 1px solid #555; padding: 5px; }
+    QPushButton { background: #333; color: white; border: 1px solid #555; border-radius: 4px; }
+    QPushButton:hover { background: #444; }
+"""
+
 
 class RenewDialog(QtWidgets.QDialog):
     """
     Dialog for renewing a member's subscription or updating their fee status.
     Automatically calculates the new expiration date based on the selected duration.
     """
-    def __init__(self, parent: Optional[QtWidgets.QWidget] = None, current_expiry_str: Optional[str] = None):
+    def __init__(self, parent: Optional[QtWidgets.QWidget] = None, current_expiry: Optional[datetime.date] = None):
         super().__init__(parent)
         self.setWindowTitle("💰 Update Fee / Renew")
         self.setFixedSize(400, 350)
-        
-        self.current_expiry_str = current_expiry_str
+
+        self.current_expiry = current_expiry
         self.result_data: Optional[Dict[str, Any]] = None  # Will hold (start_date, months, new_end_date)
-        
+
+        # One today() per dialog open; reset() and the seed values below
+        # share it instead of re-resolving the clock and timezone
+        self._today = datetime.date.today()
+
         # State variables for calculation
-        self.calculated_start = datetime.date.today()
-        self.calculated_end = datetime.date.today()
+        self.calculated_start = self._today
+        self.calculated_end = self._today
 
         self.init_ui()
         self.apply_style()
-        self.calculate_end_date()  # Initial calculation
+        self.reset(current_expiry)
 
     def init_ui(self) -> None:
         layout = QtWidgets.QVBoxLayout(self)
@@ -33,9 +48,9 @@ class RenewDialog(QtWidgets.QDialog):
         info_box = QtWidgets.QGroupBox("Current Status")
         ib_layout = QtWidgets.QVBoxLayout(info_box)
         
-        lbl_curr = QtWidgets.QLabel(f"Current Expiration: {self.current_expiry_str or 'N/A'}")
-        lbl_curr.setStyleSheet("color: #aaa; font-weight: bold;")
-        ib_layout.addWidget(lbl_curr)
+        self.lbl_curr = QtWidgets.QLabel("Current Expiration: N/A")
+        self.lbl_curr.setStyleSheet("color: #aaa; font-weight: bold;")
+        ib_layout.addWidget(self.lbl_curr)
         layout.addWidget(info_box)
 
         # --- Renewal Form ---
@@ -46,21 +61,6 @@ class RenewDialog(QtWidgets.QDialog):
         self.inp_start_date = QtWidgets.QDateEdit()
         self.inp_start_date.setCalendarPopup(True)
         self.inp_start_date.setDisplayFormat("yyyy-MM-dd")
-
-        # Logic: If expired, default to Today. If active, default to Day After Expiry.
-        today = datetime.date.today()
-        default_date = today
-        
-        if self.current_expiry_str:
-            try:
-                exp_date = datetime.datetime.strptime(self.current_expiry_str, "%Y-%m-%d").date()
-                if exp_date >= today:
-                    # If still active, start the new package the day after it expires
-                    default_date = exp_date + datetime.timedelta(days=1)
-            except ValueError:
-                pass
-
-        self.inp_start_date.setDate(default_date)
         self.inp_start_date.dateChanged.connect(self.calculate_end_date)
 
         # 2. Duration (Months)
@@ -94,11 +94,43 @@ class RenewDialog(QtWidgets.QDialog):
         btn_layout.addWidget(btn_cancel)
         layout.addLayout(btn_layout)
 
+    def reset(self, current_expiry: Optional[datetime.date] = None) -> None:
+        """
+        Re-arms the dialog for another member, so callers can keep one
+        instance alive instead of rebuilding the widget tree per open.
+        Callers pass the already-parsed expiry date; no strptime here.
+        """
+        self.current_expiry = current_expiry
+        self.result_data = None
+        self.lbl_curr.setText(
+            f"Current Expiration: {current_expiry.isoformat() if current_expiry else 'N/A'}"
+        )
+
+        # Logic: If expired, default to Today. If active, default to Day After Expiry.
+        # The arithmetic stays on the QDate side (addDays runs in C++,
+        # no Python timedelta/date allocation) since the result feeds a
+        # QDateEdit anyway; _today is converted back once. Refreshed here
+        # (not just in __init__) because callers keep the dialog alive
+        # across opens, possibly past midnight
+        today_qd = QtCore.QDate.currentDate()
+        self._today = today_qd.toPython()
+        default_date = today_qd
+
+        if current_expiry:
+            exp_qd = QtCore.QDate(current_expiry)
+            if exp_qd >= today_qd:
+                # If still active, start the new package the day after it expires
+                default_date = exp_qd.addDays(1)
+
+        self.inp_start_date.setDate(default_date)
+        self.inp_months.setValue(1)
+        self.calculate_end_date()
+
     def calculate_end_date(self) -> None:
         """Live calculation of the end date based on user input."""
-        start_qdate = self.inp_start_date.date()
-        # Convert QDate to python datetime.date
-        start_date = datetime.date(start_qdate.year(), start_qdate.month(), start_qdate.day())
+        # QDate.toPython() converts in one C++ call instead of three
+        # year()/month()/day() round trips; this slot fires per keystroke
+        start_date = self.inp_start_date.date().toPython()
         months = self.inp_months.value()
 
         # Use our utility function from core.utils
@@ -118,12 +150,4 @@ class RenewDialog(QtWidgets.QDialog):
         self.accept()
 
     def apply_style(self) -> None:
-        self.setStyleSheet("""
-            QDialog { background: #1a1a1a; color: white; font-family: 'Segoe UI'; }
-            QGroupBox { border: 1px solid #444; margin-top: 10px; padding-top: 15px; font-weight: bold; }
-            QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }
-            QLabel { color: white; }
-            QDateEdit, QSpinBox { background: #222; color: white; border: 1px solid #555; padding: 5px; }
-            QPushButton { background: #333; color: white; border: 1px solid #555; border-radius: 4px; }
-            QPushButton:hover { background: #444; }
-        """)
\ No newline at end of file
+        self.setStyleSheet(_RENEW_QSS)
\ No newline at end of file
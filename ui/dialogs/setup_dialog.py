@@ -2,6 +2,21 @@ from typing import Optional
 from PySide6 import QtWidgets, QtCore
 from services.auth_service import create_user
 
+# Dialog-wide sheet, built once at import rather than per instantiation
+_SETUP_QSS = """
+    QDialog { background: #0c0c0c; color: #ffffff; font-family: 'Segoe UI'; }
+    QLabel { color: #ffffff; font-size: 14px; }
+    QLineEdit {
+        background: #1b1b1b; color: #ffffff; border: 1px solid #333;
+        border-radius: 6px; padding: 8px; font-size: 13px;
+    }
+    QPushButton {
+        background: #b71c1c; color: #ffffff; border-radius: 8px;
+        padding: 10px 20px; font-weight: bold; font-size: 14px;
+    }
+    QPushButton:hover { background: #ffcc00; color: #111; }
+"""
+
 
 class AdminSetupDialog(QtWidgets.QDialog):
     """
@@ -45,19 +60,7 @@ class AdminSetupDialog(QtWidgets.QDialog):
         layout.addWidget(btn)
 
     def apply_style(self) -> None:
-        self.setStyleSheet("""
-            QDialog { background: #0c0c0c; color: #ffffff; font-family: 'Segoe UI'; }
-            QLabel { color: #ffffff; font-size: 14px; }
-            QLineEdit { 
-                background: #1b1b1b; color: #ffffff; border: 1px solid #333; 
-                border-radius: 6px; padding: 8px; font-size: 13px;
-            }
-            QPushButton { 
-                background: #b71c1c; color: #ffffff; border-radius: 8px; 
-                padding: 10px 20px; font-weight: bold; font-size: 14px;
-            }
-            QPushButton:hover { background: #ffcc00; color: #111; }
-        """)
+        self.setStyleSheet(_SETUP_QSS)
 
     def create_admin(self) -> None:
         uname = self.uname.text().strip()
@@ -2,13 +2,11 @@ import sys
 from typing import List, Optional
 from PySide6 import QtWidgets, QtCore
 
-from ui.dialogs.login_dialog import LoginDialog
-from ui.dashboards.admin_dashboard import AdminDashboard
-from ui.dashboards.user_dashboard import UserDashboard
-from ui.dialogs.setup_dialog import AdminSetupDialog
-from ui.dialogs.backup_dialog import BackupDialog
-
-from core.database import init_db, admin_exists
+# Dashboards and dialogs are imported inside the branches that need
+# them (see start/show_login): each one drags in its full widget tree
+# plus services, and a staff login should never pay for the admin stack.
+from core.database import init_db
+from services.auth_service import admin_exists
 from services.file_manager import load_or_setup_paths
 import config
 
@@ -35,6 +33,7 @@ class SolidGymApp(QtWidgets.QApplication):
 
         # 3. First-Run Check: Force Admin Creation if none exists
         if not admin_exists():
+            from ui.dialogs.setup_dialog import AdminSetupDialog
             dlg = AdminSetupDialog()
             if dlg.exec() != QtWidgets.QDialog.Accepted:
                 sys.exit(0)
@@ -44,6 +43,7 @@ class SolidGymApp(QtWidgets.QApplication):
 
     def show_login(self) -> None:
         """Displays the login dialog and routes to the correct dashboard."""
+        from ui.dialogs.login_dialog import LoginDialog
         dlg = LoginDialog()
         if dlg.exec() != QtWidgets.QDialog.Accepted:
             # User closed the login window without logging in
@@ -56,11 +56,13 @@ class SolidGymApp(QtWidgets.QApplication):
 
         # Route to appropriate dashboard
         if role == 'admin':
+            from ui.dashboards.admin_dashboard import AdminDashboard
             self.main_window = AdminDashboard()
             # Ask for backup shortly after admin login
             QtCore.QTimer.singleShot(1000, self.ask_for_backup)
         else:
             # Pass username to UserDashboard for logging purposes
+            from ui.dashboards.user_dashboard import UserDashboard
             self.main_window = UserDashboard(gender, username)
 
         # Handle Logout Signal to restart the flow
@@ -72,6 +74,7 @@ class SolidGymApp(QtWidgets.QApplication):
     def ask_for_backup(self) -> None:
         """Prompts the admin to backup data to the cloud."""
         if self.main_window:
+            from ui.dialogs.backup_dialog import BackupDialog
             dlg = BackupDialog(self.main_window)
             dlg.exec()
 
@@ -0,0 +1,21 @@
+from PySide6 import QtCore, QtGui
+
+# Decoded member photos get more room than Qt's default cache limit
+# (about 10 MiB) so repeated check-ins stay resident across dashboards.
+QtGui.QPixmapCache.setCacheLimit(64 * 1024)
+
+
+def load_thumb(path: str, w: int, h: int) -> QtGui.QPixmap:
+    """
+    Returns a scaled pixmap for a photo, backed by the process-wide
+    QPixmapCache. Repeat displays of the same member (common at the
+    check-in desk) skip the JPEG decode and rescale entirely.
+    """
+    key = f"{path}:{w}x{h}"
+    pm = QtGui.QPixmap()
+    if not QtGui.QPixmapCache.find(key, pm):
+        pm = QtGui.QPixmap(path).scaled(
+            w, h, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation
+        )
+        QtGui.QPixmapCache.insert(key, pm)
+    return pm
@@ -0,0 +1,38 @@
+from PySide6 import QtCore
+from services.cloud_service import create_local_backup, upload_to_drive
+
+
+class WorkerSignals(QtCore.QObject):
+    """
+    Defines the signals available from a running worker thread.
+
+    Attributes:
+        zip_done (str, str): Emitted after the local zip step with
+            (zip_path, error_message); exactly one of them is empty.
+        upload_done (bool, str): Emitted after the Drive upload with
+            (success, file_id_or_error).
+    """
+    zip_done = QtCore.Signal(str, str)
+    upload_done = QtCore.Signal(bool, str)
+
+
+class BackupWorker(QtCore.QRunnable):
+    """
+    Background worker that zips the gym data folder and uploads it to
+    Google Drive. Both steps block for seconds (compression, OAuth,
+    network), so running them off the GUI thread keeps the backup
+    dialog responsive while it reports progress.
+    """
+    def __init__(self):
+        super().__init__()
+        self.signals = WorkerSignals()
+
+    @QtCore.Slot()
+    def run(self) -> None:
+        zip_path, err = create_local_backup()
+        self.signals.zip_done.emit(zip_path or "", err or "")
+        if not zip_path:
+            return
+
+        success, result = upload_to_drive(zip_path)
+        self.signals.upload_done.emit(success, result or "")
@@ -0,0 +1,26 @@
+from PySide6 import QtCore
+from services.attendance_service import mark_attendance
+from services.member_service import get_member_by_id
+from workers.signals import DictSignals as WorkerSignals
+
+
+class CheckInWorker(QtCore.QRunnable):
+    """
+    Background worker that resolves a member and records their check-in.
+    Keeps the record lookup and attendance write off the GUI thread so
+    the scanner field stays responsive at turnstile rates.
+    """
+    def __init__(self, member_id: str):
+        super().__init__()
+        self.member_id = member_id
+        self.signals = WorkerSignals()
+
+    @QtCore.Slot()
+    def run(self) -> None:
+        try:
+            data = get_member_by_id(self.member_id)
+            if data:
+                mark_attendance(self.member_id)
+            self.signals.finished.emit(data or {})
+        except Exception as e:
+            self.signals.error.emit(str(e))
@@ -0,0 +1,39 @@
+from PySide6 import QtCore
+from services.pdf_service import _load_reportlab
+from workers.signals import StrSignals as WorkerSignals
+
+
+class ExportWorker(QtCore.QRunnable):
+    """
+    Background worker that renders a monthly member list to PDF.
+    The source text file is streamed line-by-line into the reportlab
+    canvas, so resident memory stays bounded no matter how long the
+    list is, and the GUI thread never blocks on a multi-MB export.
+    """
+    def __init__(self, src_path, dest_path: str, title: str):
+        super().__init__()
+        self.src_path = src_path
+        self.dest_path = dest_path
+        self.title = title
+        self.signals = WorkerSignals()
+
+    @QtCore.Slot()
+    def run(self) -> None:
+        try:
+            canvas, A4 = _load_reportlab()
+            with open(self.src_path, encoding='utf-8') as src, \
+                    open(self.dest_path, "wb") as dst:
+                c = canvas.Canvas(dst, pagesize=A4)
+                y = 800
+                c.drawString(50, y, self.title)
+                y -= 30
+                for line in src:
+                    c.drawString(50, y, line.rstrip())
+                    y -= 15
+                    if y < 50:
+                        c.showPage()
+                        y = 800
+                c.save()
+            self.signals.finished.emit(self.dest_path)
+        except Exception as e:
+            self.signals.error.emit(str(e))
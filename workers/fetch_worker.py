@@ -0,0 +1,23 @@
+from typing import Callable
+from PySide6 import QtCore
+
+from workers.signals import ListSignals as WorkerSignals
+
+
+class TableFetchWorker(QtCore.QRunnable):
+    """
+    Generic background worker that runs a list-returning fetch function
+    (user list, fee logs, pending members, ...) off the GUI thread, so
+    clicking a tab costs a paint instead of a blocking DB/file read.
+    """
+    def __init__(self, fn: Callable[[], list]):
+        super().__init__()
+        self.fn = fn
+        self.signals = WorkerSignals()
+
+    @QtCore.Slot()
+    def run(self) -> None:
+        try:
+            self.signals.finished.emit(list(self.fn()))
+        except Exception as e:
+            self.signals.error.emit(str(e))
@@ -0,0 +1,47 @@
+from PySide6 import QtCore, QtGui
+
+
+class WorkerSignals(QtCore.QObject):
+    """
+    Defines the signals available from a running worker thread.
+
+    Attributes:
+        finished (QImage): Emitted with the decoded, pre-scaled image.
+        error (str): Emitted with an error message if decoding fails.
+    """
+    finished = QtCore.Signal(QtGui.QImage)
+    error = QtCore.Signal(str)
+
+
+class PhotoLoadWorker(QtCore.QRunnable):
+    """
+    Background worker that decodes a member photo already scaled to the
+    display size. QImageReader.setScaledSize lets libjpeg emit the
+    decimated image directly instead of decoding a full phone-camera
+    frame on the GUI thread and downsampling afterwards.
+    """
+    def __init__(self, path: str, width: int, height: int):
+        super().__init__()
+        self.path = path
+        self.width = width
+        self.height = height
+        self.signals = WorkerSignals()
+
+    @QtCore.Slot()
+    def run(self) -> None:
+        try:
+            reader = QtGui.QImageReader(self.path)
+            reader.setAutoTransform(True)
+            size = reader.size()
+            if size.isValid():
+                # Preserve aspect ratio, like the old QPixmap.scaled call
+                reader.setScaledSize(size.scaled(
+                    self.width, self.height, QtCore.Qt.KeepAspectRatio
+                ))
+            img = reader.read()
+            if img.isNull():
+                self.signals.error.emit(reader.errorString())
+            else:
+                self.signals.finished.emit(img)
+        except Exception as e:
+            self.signals.error.emit(str(e))
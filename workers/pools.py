@@ -0,0 +1,19 @@
+from PySide6 import QtCore
+
+# Process-wide thread pools, split by what the workers cost:
+#
+# SEARCH_POOL runs the latency-sensitive lookups (member search, photo
+# decodes, table fetches) with a little concurrency; IO_POOL serializes
+# the heavy or writing tasks (saves, renewals, check-in writes, report
+# builds, PDF exports) on one thread, both because SQLite serializes
+# writers anyway and so a slow report can never starve a search.
+#
+# QRunnables keep Qt's default autoDelete(True): each worker is freed by
+# the pool after run(), and its signals QObject goes with it once the
+# queued emissions are delivered.
+
+SEARCH_POOL = QtCore.QThreadPool()
+SEARCH_POOL.setMaxThreadCount(2)
+
+IO_POOL = QtCore.QThreadPool()
+IO_POOL.setMaxThreadCount(1)
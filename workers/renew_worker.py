@@ -0,0 +1,29 @@
+from PySide6 import QtCore
+from services.member_service import renew_membership
+from services.finance_service import log_fee_update
+from workers.signals import VoidSignals as WorkerSignals
+
+
+class RenewWorker(QtCore.QRunnable):
+    """
+    Background worker that applies a membership renewal and writes the
+    fee log entry, keeping both the PDF rewrite and the SQLite round
+    trips off the GUI thread.
+    """
+    def __init__(self, member_id: str, username: str, start_date, end_date, months: int):
+        super().__init__()
+        self.member_id = member_id
+        self.username = username
+        self.start_date = start_date
+        self.end_date = end_date
+        self.months = months
+        self.signals = WorkerSignals()
+
+    @QtCore.Slot()
+    def run(self) -> None:
+        try:
+            renew_membership(self.member_id, self.start_date, self.end_date, self.months)
+            log_fee_update(self.username, self.member_id, self.months)
+            self.signals.finished.emit()
+        except Exception as e:
+            self.signals.error.emit(str(e))
@@ -1,31 +1,43 @@
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any
 from PySide6 import QtCore
 from services.member_service import search_members
-
-
-class WorkerSignals(QtCore.QObject):
-    """
-    Defines signals for the SearchWorker.
-    
-    Attributes:
-        finished (dict): Emitted with search results (matches list and parsed data).
-        error (str): Emitted on failure.
-    """
-    finished = QtCore.Signal(dict)
-    error = QtCore.Signal(str)
+from workers.signals import DictSignals as WorkerSignals
 
 
 class SearchWorker(QtCore.QRunnable):
     """
     Background worker to perform member searches.
     Includes logic to restrict results based on staff gender (Security Check).
+
+    If the caller passes a generation token plus a callable returning its
+    latest counter, a worker made stale by a newer search bails out before
+    hitting the database (and again before emitting), so rapid typing does
+    not queue redundant SQLite reads or stale UI updates.
     """
-    def __init__(self, query: str, is_admin: bool = False, user_gender: Optional[str] = None):
+    def __init__(self, query: str, is_admin: bool = False, user_gender: Optional[str] = None,
+                 generation: int = 0, token_ref: Optional[Callable[[], int]] = None):
         super().__init__()
         self.query = query
         self.is_admin = is_admin
         self.user_gender = user_gender
-        self.signals = WorkerSignals()
+        self.generation = generation
+        self.token_ref = token_ref
+
+    @property
+    def signals(self) -> WorkerSignals:
+        """
+        Signals QObject, created on first access. Callers that connect
+        before starting the worker pay the allocation as before; a
+        worker that goes stale and bails without anyone listening (or
+        any short-circuit path) never builds the QObject at all.
+        """
+        s = self.__dict__.get('_signals')
+        if s is None:
+            s = self.__dict__['_signals'] = WorkerSignals()
+        return s
+
+    def _stale(self) -> bool:
+        return self.token_ref is not None and self.generation != self.token_ref()
 
     @QtCore.Slot()
     def run(self) -> None:
@@ -33,10 +45,24 @@ class SearchWorker(QtCore.QRunnable):
         Executes the search logic.
         """
         try:
-            result = search_members(self.query)
+            if self._stale():
+                return
+
+            # Gender-restricted staff searches hand the filter to the
+            # index engine, so other-gender rows never leave SQLite
+            gender_filter = None
+            if not self.is_admin and self.user_gender:
+                gender_filter = str(self.user_gender).strip().lower()
+
+            result = search_members(self.query, gender_filter)
+
+            if self._stale():
+                return
 
             # --- SECURITY CHECK (Gender Enforcement) ---
-            # If not admin, ensure staff can only view members of their own gender.
+            # Last-resort safety net: the index filter above already
+            # excludes other genders, but the parsed PDF is re-checked
+            # in case the index row is stale or missing the gender.
             if not self.is_admin and result.get("parsed"):
                 parsed = result["parsed"]
                 
@@ -0,0 +1,54 @@
+from PySide6 import QtCore
+
+# Shared signal holders for the QRunnable workers. Each worker used to
+# define an identical WorkerSignals class; declaring the few payload
+# shapes once means Qt builds one meta-object per shape for the whole
+# process instead of one per worker module.
+
+
+class StrSignals(QtCore.QObject):
+    """
+    Signals for workers whose result is a string.
+
+    Attributes:
+        finished (str): Emitted with the result when the task is done.
+        error (str): Emitted with an error message if the task fails.
+    """
+    finished = QtCore.Signal(str)
+    error = QtCore.Signal(str)
+
+
+class DictSignals(QtCore.QObject):
+    """
+    Signals for workers whose result is a dict.
+
+    Attributes:
+        finished (dict): Emitted with the result when the task is done.
+        error (str): Emitted with an error message if the task fails.
+    """
+    finished = QtCore.Signal(dict)
+    error = QtCore.Signal(str)
+
+
+class ListSignals(QtCore.QObject):
+    """
+    Signals for workers whose result is a list of rows.
+
+    Attributes:
+        finished (list): Emitted with the fetched rows when done.
+        error (str): Emitted with an error message if the task fails.
+    """
+    finished = QtCore.Signal(list)
+    error = QtCore.Signal(str)
+
+
+class VoidSignals(QtCore.QObject):
+    """
+    Signals for workers that report completion without a payload.
+
+    Attributes:
+        finished: Emitted once the task is done.
+        error (str): Emitted with an error message if the task fails.
+    """
+    finished = QtCore.Signal()
+    error = QtCore.Signal(str)